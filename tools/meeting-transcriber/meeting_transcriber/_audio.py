@@ -0,0 +1,517 @@
+"""Shared audio plumbing for the loopback recorders — block conversion, silence gating, streaming WAV output, the session audio store."""
+
+from __future__ import annotations
+
+import math
+import struct
+import threading
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from .models import ChunkInfo, SessionManifest
+
+SAMPLE_RATE = 16000  # 16kHz mono for Whisper
+SAMPLE_WIDTH = 2  # 16-bit PCM
+HEADER_FIXUP_SEC = 2.0  # Rewrite the WAV header this often — bounds audio lost on a crash
+
+RESAMPLER_ZERO_CROSSINGS = 8  # Sinc lobes per side — longer filter, sharper anti-alias cutoff
+RESAMPLER_KAISER_BETA = 8.6  # ~80 dB stopband attenuation
+
+SILENCE_THRESHOLD_DBFS = -55.0  # Frames quieter than this count as silence
+SILENCE_KEEP_SEC = 2.0  # Silence kept before the gate starts dropping audio
+SILENCE_FRAME_MS = 30
+
+CUT_TOLERANCE_SEC = 15.0  # How far past the nominal chunk length to look for a pause
+CUT_THRESHOLD_DBFS = -40.0  # Frames quieter than this count as a pause between words
+CUT_PAUSE_MS = 210  # Quiet stretch needed before a chunk may be cut
+
+_HEADER_SIZE = 44
+
+
+def read_wav_view(path: Path) -> np.ndarray:
+    """Memory-map the samples of a 16kHz 16-bit mono PCM WAV without decoding it.
+
+    Returns a read-only int16 view straight onto the file's data chunk, so a
+    freshly written chunk is served from the page cache with no copy. Raises
+    ValueError for any other WAV layout.
+    """
+    file_size = path.stat().st_size
+    with open(path, "rb") as f:
+        riff, _, wave_id = struct.unpack("<4sI4s", f.read(12))
+        if riff != b"RIFF" or wave_id != b"WAVE":
+            raise ValueError(f"Not a WAV file: {path}")
+        fmt = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"WAV has no data chunk: {path}")
+            chunk_id, size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                fmt = struct.unpack("<HHIIHH", f.read(16))
+                f.seek(size - 16 + (size & 1), 1)
+            elif chunk_id == b"data":
+                data_offset = f.tell()
+                break
+            else:
+                f.seek(size + (size & 1), 1)
+
+    if fmt is None or fmt[0] != 1 or fmt[1] != 1 or fmt[2] != SAMPLE_RATE or fmt[5] != 16:
+        raise ValueError(f"Expected 16kHz 16-bit mono PCM WAV: {path}")
+    # A crashed writer may leave a stale size field — trust the file length
+    num_samples = min(size, file_size - data_offset) // SAMPLE_WIDTH
+    if not num_samples:
+        return np.zeros(0, dtype=np.int16)
+    return np.memmap(path, dtype="<i2", mode="r", offset=data_offset, shape=(num_samples,))
+
+
+def downmix_int16(block: np.ndarray) -> np.ndarray:
+    """Average interleaved int16 channels into mono using one int32 accumulator.
+
+    Avoids the float64 temporaries of ``mean(axis=1)``; the accumulator is
+    summed and halved in place.
+    """
+    channels = block.shape[1]
+    if channels == 1:
+        return block.reshape(-1)
+    acc = block[:, 0].astype(np.int32)
+    for ch in range(1, channels):
+        acc += block[:, ch]
+    acc //= channels
+    return acc
+
+
+class PolyphaseResampler:
+    """Streaming rational-ratio resampler with a Kaiser-windowed sinc low-pass.
+
+    Upsamples by ``up``, filters below the output Nyquist and decimates by
+    ``down`` — computed only at the output positions, one polyphase branch per
+    sample. The last input samples are carried between calls so block and chunk
+    boundaries are seamless. The filter's sub-millisecond group delay is not
+    compensated.
+    """
+
+    def __init__(self, in_rate: int, out_rate: int):
+        g = math.gcd(in_rate, out_rate)
+        self.up = out_rate // g
+        self.down = in_rate // g
+
+        # Prototype low-pass at the (upsampled) rate, cut off just below the
+        # lower of the two Nyquist frequencies
+        half_len = RESAMPLER_ZERO_CROSSINGS * max(self.up, self.down)
+        n = np.arange(-half_len, half_len + 1, dtype=np.float64)
+        cutoff = 0.5 / max(self.up, self.down) * 0.9
+        h = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(len(n), RESAMPLER_KAISER_BETA)
+        h *= self.up / h.sum()  # Unity DC gain after zero-stuffing by `up`
+
+        # Polyphase bank: branch p holds taps h[p], h[p + up], h[p + 2*up], ...
+        self.taps = -(-len(h) // self.up)
+        padded = np.zeros(self.taps * self.up)
+        padded[:len(h)] = h
+        self._bank = padded.reshape(self.taps, self.up).T.astype(np.float32)
+
+        self._history = np.zeros(self.taps - 1, dtype=np.float32)
+        self._tap_offsets = np.arange(self.taps)
+        self._in_pos = 0  # Input samples consumed so far
+        self._out_pos = 0  # Output samples produced so far
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Resample one block of mono samples, returning int16 output."""
+        in_end = self._in_pos + len(samples)
+        out_end = -(-in_end * self.up // self.down)
+
+        buf = np.empty(len(self._history) + len(samples), dtype=np.float32)
+        buf[:len(self._history)] = self._history
+        buf[len(self._history):] = samples
+
+        positions = np.arange(self._out_pos, out_end, dtype=np.int64) * self.down
+        phases = positions % self.up
+        # Newest input sample feeding each output, as an index into buf
+        newest = positions // self.up - self._in_pos + len(self._history)
+        window = buf[newest[:, None] - self._tap_offsets]
+        out = np.einsum("ij,ij->i", window, self._bank[phases])
+
+        self._history = buf[len(buf) - len(self._history):].copy()
+        self._in_pos = in_end
+        self._out_pos = out_end
+
+        np.clip(out, -32768, 32767, out=out)
+        return np.rint(out).astype(np.int16)
+
+
+class BlockConverter:
+    """Converts device-format int16 blocks to 16kHz mono, one block at a time.
+
+    Shared by every recorder backend. The resampler keeps its filter state
+    across calls, so consecutive blocks (and chunks) line up exactly, as if
+    the whole session had been converted in one pass.
+    """
+
+    def __init__(self, device_rate: int, device_channels: int):
+        self.device_rate = device_rate
+        self.device_channels = device_channels
+        self._resampler = (
+            PolyphaseResampler(device_rate, SAMPLE_RATE)
+            if device_rate != SAMPLE_RATE
+            else None
+        )
+
+    def convert(self, block: np.ndarray) -> np.ndarray:
+        """Downmix and resample one block of interleaved int16 device audio."""
+        samples = downmix_int16(block.reshape(-1, self.device_channels))
+
+        if self._resampler is None:
+            return samples.astype(np.int16, copy=False)
+        return self._resampler.process(samples)
+
+
+class SilenceGate:
+    """Drops the tail of long silent stretches before they reach disk.
+
+    Audio is measured in SILENCE_FRAME_MS frames; once a silent run exceeds
+    keep_seconds, further silent frames are dropped until sound returns. Short
+    pauses pass through untouched so Whisper's VAD still sees natural gaps.
+    process() returns the kept spans with their meeting-time sample positions
+    so the timeline can be restored later.
+    """
+
+    def __init__(
+        self,
+        threshold_dbfs: float = SILENCE_THRESHOLD_DBFS,
+        keep_seconds: float = SILENCE_KEEP_SEC,
+        frame_ms: int = SILENCE_FRAME_MS,
+    ):
+        self.frame = SAMPLE_RATE * frame_ms // 1000
+        # Compare mean squares against the squared threshold — no sqrt per frame
+        self._threshold_sq = (32768 * 10 ** (threshold_dbfs / 20)) ** 2
+        self._keep_frames = int(keep_seconds * 1000 / frame_ms)
+        self._silent_run = 0  # Silent frames seen so far in the current run
+        self._pending = np.zeros(0, dtype=np.int16)  # Partial frame carried to the next call
+        self._src_pos = 0  # Meeting sample index of the first pending sample
+        self.dropped_samples = 0
+
+    def process(self, samples: np.ndarray) -> list[tuple[np.ndarray, int]]:
+        """Gate one block; returns (kept samples, meeting sample position) spans."""
+        if len(self._pending):
+            samples = np.concatenate([self._pending, samples])
+        n_frames = len(samples) // self.frame
+        usable = n_frames * self.frame
+        self._pending = samples[usable:]
+        start = self._src_pos
+        self._src_pos += usable
+        if not n_frames:
+            return []
+
+        frames = samples[:usable].reshape(n_frames, self.frame).astype(np.float32)
+        silent = np.einsum("ij,ij->i", frames, frames) / self.frame < self._threshold_sq
+
+        # Length of the silent run ending at each frame, continuing the previous call's run
+        runs = np.cumsum(silent)
+        runs -= np.maximum.accumulate(np.where(silent, 0, runs))
+        runs[: np.argmin(silent) if not silent.all() else n_frames] += self._silent_run
+        self._silent_run = int(runs[-1])
+        keep = runs <= self._keep_frames
+
+        if keep.all():
+            return [(samples[:usable], start)]
+
+        # Emit contiguous runs of kept frames
+        edges = np.flatnonzero(np.diff(np.concatenate([[False], keep, [False]]).astype(np.int8)))
+        spans = []
+        for first, last in zip(edges[::2].tolist(), edges[1::2].tolist()):
+            spans.append((samples[first * self.frame:last * self.frame], start + first * self.frame))
+        self.dropped_samples += int((~keep).sum()) * self.frame
+        return spans
+
+    def flush(self) -> list[tuple[np.ndarray, int]]:
+        """Return the trailing partial frame, which is always kept."""
+        pending, self._pending = self._pending, np.zeros(0, dtype=np.int16)
+        start = self._src_pos
+        self._src_pos += len(pending)
+        return [(pending, start)] if len(pending) else []
+
+    def skip(self, n_samples: int) -> list[tuple[np.ndarray, int]]:
+        """Move the timeline past n_samples lost upstream; returns the partial frame before the gap."""
+        spans = self.flush()
+        self._src_pos += n_samples
+        return spans
+
+
+class StreamingWavWriter:
+    """Appends 16kHz mono int16 audio to an open WAV file as it arrives.
+
+    Nothing is buffered in Python: each block goes straight to the file, and the
+    RIFF/data sizes in the header are fixed up every HEADER_FIXUP_SEC of audio, so
+    a crash leaves a valid WAV missing at most a couple of seconds.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        sample_rate: int = SAMPLE_RATE,
+        fixup_seconds: float = HEADER_FIXUP_SEC,
+    ):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.frames_written = 0
+        self._fixup_frames = max(1, int(fixup_seconds * sample_rate))
+        self._frames_at_fixup = 0
+        self._file = open(path, "wb")
+        self._write_header()
+
+    def write(self, samples: np.ndarray) -> None:
+        """Append a block of int16 mono samples."""
+        if not len(samples):
+            return
+        self._file.write(np.ascontiguousarray(samples, dtype="<i2").tobytes())
+        self.frames_written += len(samples)
+        if self.frames_written - self._frames_at_fixup >= self._fixup_frames:
+            self._fixup_header()
+
+    def flush(self) -> None:
+        """Bring the header up to date and push buffered audio to the OS."""
+        self._fixup_header()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._fixup_header()
+        self._file.close()
+
+    def __enter__(self) -> StreamingWavWriter:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _write_header(self) -> None:
+        data_size = self.frames_written * SAMPLE_WIDTH
+        self._file.write(struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF", 36 + data_size, b"WAVE",
+            b"fmt ", 16, 1, 1, self.sample_rate,
+            self.sample_rate * SAMPLE_WIDTH, SAMPLE_WIDTH, SAMPLE_WIDTH * 8,
+            b"data", data_size,
+        ))
+
+    def _fixup_header(self) -> None:
+        data_size = self.frames_written * SAMPLE_WIDTH
+        self._file.seek(4)
+        self._file.write(struct.pack("<I", 36 + data_size))
+        self._file.seek(_HEADER_SIZE - 4)
+        self._file.write(struct.pack("<I", data_size))
+        self._file.seek(0, 2)
+        self._file.flush()
+        self._frames_at_fixup = self.frames_written
+
+
+class SessionAudioStore:
+    """Records one session's 16kHz stream into a single growing WAV, indexed into chunks.
+
+    Audio is appended to audio_path as it arrives and never copied afterwards:
+    the file is the meeting's permanent recording. Chunks are entries in the
+    session manifest — sample ranges of that file, read back as memory-mapped
+    views. Once a chunk reaches chunk_samples, the store looks for a pause —
+    CUT_PAUSE_MS below CUT_THRESHOLD_DBFS, or a stretch dropped by the
+    SilenceGate — and closes the chunk right after it, so no word straddles two
+    chunks and each chunk can be decoded on its own. If no pause turns up within
+    cut_tolerance_samples, the chunk is closed there anyway. Each time a chunk is
+    closed, the WAV header is brought up to date and the manifest rewritten, so
+    on_chunk consumers can read the range at once. With a SilenceGate, dropped
+    stretches are recorded in each chunk's time map, as are gaps reported by
+    skip() for audio the recorder lost before it reached the store.
+
+    With write=False, nothing is written: an existing 16kHz mono WAV is fed
+    through the same cut logic to index it in place (see index_wav()).
+    """
+
+    def __init__(
+        self,
+        audio_path: Path,
+        chunk_samples: int,
+        manifest_path: Path | None = None,
+        on_chunk: Callable[[ChunkInfo], None] | None = None,
+        gate: SilenceGate | None = None,
+        cut_tolerance_samples: int = int(CUT_TOLERANCE_SEC * SAMPLE_RATE),
+        write: bool = True,
+    ):
+        self.audio_path = audio_path
+        self.chunk_samples = chunk_samples
+        self.cut_tolerance_samples = cut_tolerance_samples
+        self.manifest_path = manifest_path
+        self.on_chunk = on_chunk
+        self.gate = gate
+        self.write_audio = write
+        self.manifest = SessionManifest(sample_rate=SAMPLE_RATE, audio_path=audio_path)
+        self._writer: StreamingWavWriter | None = None
+        self._recorded = 0  # Samples appended to the session file so far
+        self._chunk_start: int | None = None  # Recorded sample index of the open chunk
+        self._src_pos = 0  # Meeting sample index of the next sample written
+        self._next_pos = 0  # Meeting sample index of the next sample passed to write()
+        self.lost_samples = 0  # Samples skip() reported as lost upstream
+        self._time_map: list[tuple[int, int]] = []
+        self._lock = threading.Lock()
+        # Pause search past the nominal boundary
+        self._frame = SAMPLE_RATE * SILENCE_FRAME_MS // 1000
+        self._cut_threshold_sq = (32768 * 10 ** (CUT_THRESHOLD_DBFS / 20)) ** 2
+        self._pause_frames = -(-CUT_PAUSE_MS // SILENCE_FRAME_MS)
+        self._quiet_run = 0
+        self._frame_carry = np.zeros(0, dtype=np.int16)
+
+    @property
+    def chunks(self) -> list[ChunkInfo]:
+        with self._lock:
+            return list(self.manifest.chunks)
+
+    def write(self, samples: np.ndarray) -> None:
+        """Append 16kHz mono samples, closing a chunk at the first pause past each boundary."""
+        if self.gate is None:
+            self._write_span(samples, self._next_pos)
+            self._next_pos += len(samples)
+            return
+        for span, src_pos in self.gate.process(samples):
+            self._write_span(span, src_pos)
+
+    def skip(self, n_samples: int) -> None:
+        """Mark n_samples of meeting time as lost before reaching the store.
+
+        The next sample written lands n_samples later on the meeting timeline,
+        so the gap shows up in the chunk's time map like dropped silence.
+        """
+        if n_samples <= 0:
+            return
+        self.lost_samples += n_samples
+        if self.gate is None:
+            self._next_pos += n_samples
+            return
+        for span, src_pos in self.gate.skip(n_samples):
+            self._write_span(span, src_pos)
+
+    def close(self) -> None:
+        """Close the last (partial) chunk and finalize the session file."""
+        if self.gate is not None:
+            for span, src_pos in self.gate.flush():
+                self._write_span(span, src_pos)
+        if self._chunk_start is not None:
+            self._finalize_chunk()
+        if self._writer is not None:
+            self._writer.close()
+
+    @property
+    def _chunk_length(self) -> int:
+        return self._recorded - self._chunk_start
+
+    def _write_span(self, samples: np.ndarray, src_pos: int) -> None:
+        while len(samples):
+            if self._chunk_start is None:
+                self._open_chunk(src_pos)
+            elif src_pos != self._src_pos:
+                if self._chunk_length >= self.chunk_samples:
+                    # Past the boundary and the gate just dropped silence — cut here
+                    self._finalize_chunk()
+                    continue
+                # Silence was dropped — note where the meeting timeline jumps
+                self._time_map.append((int(self._chunk_length), int(src_pos)))
+
+            length = self._chunk_length
+            if length < self.chunk_samples:
+                room = self.chunk_samples - length
+                cut = False
+            else:
+                room = self.chunk_samples + self.cut_tolerance_samples - length
+                pause_end = self._find_pause(samples[:room])
+                cut = pause_end is not None or room <= len(samples)
+                if pause_end is not None:
+                    room = pause_end
+
+            block = samples[:room]
+            if self._writer is not None:
+                self._writer.write(block)
+            self._recorded += len(block)
+            samples = samples[room:]
+            src_pos += len(block)
+            self._src_pos = src_pos
+            if cut:
+                self._finalize_chunk()
+
+    def _find_pause(self, samples: np.ndarray) -> int | None:
+        """Index just past the first pause in samples, continuing the previous call's search."""
+        carried = len(self._frame_carry)
+        buf = np.concatenate([self._frame_carry, samples]) if carried else samples
+        n_frames = len(buf) // self._frame
+        if n_frames:
+            frames = buf[:n_frames * self._frame].reshape(n_frames, self._frame).astype(np.float32)
+            quiet = np.einsum("ij,ij->i", frames, frames) / self._frame < self._cut_threshold_sq
+            # Length of the quiet run ending at each frame (same trick as SilenceGate)
+            runs = np.cumsum(quiet)
+            runs -= np.maximum.accumulate(np.where(quiet, 0, runs))
+            runs[: np.argmin(quiet) if not quiet.all() else n_frames] += self._quiet_run
+            hits = np.flatnonzero(runs >= self._pause_frames)
+            if len(hits):
+                self._reset_pause_search()
+                return (int(hits[0]) + 1) * self._frame - carried
+            self._quiet_run = int(runs[-1])
+        self._frame_carry = buf[n_frames * self._frame:].copy()
+        return None
+
+    def _reset_pause_search(self) -> None:
+        self._quiet_run = 0
+        self._frame_carry = np.zeros(0, dtype=np.int16)
+
+    def _open_chunk(self, src_pos: int) -> None:
+        if self._writer is None and self.write_audio:
+            self.audio_path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = StreamingWavWriter(self.audio_path)
+        self._chunk_start = self._recorded
+        self._time_map = [(0, int(src_pos))]
+
+    def _finalize_chunk(self) -> None:
+        start, self._chunk_start = self._chunk_start, None
+        self._reset_pause_search()
+        num_samples = self._recorded - start
+        if not num_samples:
+            return
+        if self._writer is not None:
+            self._writer.flush()  # Header and data visible to readers of the range
+
+        # Keep the time map only if this chunk doesn't line up 1:1 with meeting time.
+        # Plain ints throughout — numpy integers would break the manifest's JSON
+        time_map = [(int(pos), int(meeting_pos)) for pos, meeting_pos in self._time_map]
+        if all(meeting_pos == start + pos for pos, meeting_pos in time_map):
+            time_map = []
+        chunk = ChunkInfo(
+            path=self.audio_path,
+            offset_samples=int(start),
+            num_samples=int(num_samples),
+            sample_rate=SAMPLE_RATE,
+            time_map=time_map,
+            file_offset=int(start),
+        )
+        with self._lock:
+            self.manifest.chunks.append(chunk)
+            if self.manifest_path is not None:
+                self.manifest.save(self.manifest_path)
+        if self.on_chunk:
+            self.on_chunk(chunk)
+
+
+def read_chunk(chunk: ChunkInfo) -> np.ndarray:
+    """Memory-mapped int16 samples of one chunk — a range of the session file, or a whole chunk file."""
+    view = read_wav_view(chunk.path)
+    if chunk.file_offset is None:
+        return view
+    return view[chunk.file_offset:chunk.file_offset + chunk.num_samples]
+
+
+def index_wav(path: Path, chunk_seconds: float) -> list[ChunkInfo]:
+    """Index a 16kHz mono WAV into pause-aligned chunks without copying any audio.
+
+    Uses the recorder's cut logic, so an existing file can be transcribed in
+    parallel chunks exactly like a live recording. Raises ValueError for
+    anything but 16kHz 16-bit mono PCM.
+    """
+    store = SessionAudioStore(path, chunk_samples=int(chunk_seconds * SAMPLE_RATE), write=False)
+    store.write(read_wav_view(path))
+    store.close()
+    return store.chunks
@@ -0,0 +1,101 @@
+"""Shared recorder lifecycle — one capture stream per session, recorded into one indexed file."""
+
+from __future__ import annotations
+
+import abc
+import threading
+from pathlib import Path
+from typing import Callable
+
+from ._audio import SAMPLE_RATE, SessionAudioStore, SilenceGate
+from .models import ChunkInfo, SessionManifest
+
+CHUNK_DURATION_SEC = 300  # 5 minutes per chunk (nominal — cuts land on the next pause)
+SESSION_AUDIO_FILENAME = "session.wav"  # Default session file inside output_dir
+
+
+class BaseLoopbackRecorder(abc.ABC):
+    """Base class for platform recorders.
+
+    Subclasses implement _capture(), which opens the device once and feeds
+    16kHz mono blocks to the sink until self._recording goes False. The sink
+    appends everything to one session file (audio_path) and indexes it into
+    chunks at the first pause after each chunk_seconds, so no audio is dropped
+    between chunks, no word is split across two, and the device is set up only
+    once per session. The chunk manifest lives in output_dir. With silence_gate,
+    long silent stretches are dropped before they reach disk.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        chunk_seconds: int = CHUNK_DURATION_SEC,
+        on_chunk: Callable[[ChunkInfo], None] | None = None,
+        silence_gate: bool = False,
+        audio_path: Path | None = None,
+    ):
+        self.output_dir = output_dir
+        self.audio_path = audio_path or output_dir / SESSION_AUDIO_FILENAME
+        self.chunk_seconds = chunk_seconds
+        self.on_chunk = on_chunk  # Called with each chunk once it is finalized
+        self.silence_gate = silence_gate
+        self._recording = False
+        self._thread: threading.Thread | None = None
+        self._sink: SessionAudioStore | None = None
+        self.finished = threading.Event()  # Set once the capture loop has exited
+
+    @property
+    def chunks(self) -> list[ChunkInfo]:
+        return self.manifest.chunks
+
+    @property
+    def dropped_seconds(self) -> float:
+        """Seconds of silence the gate has dropped so far."""
+        if self._sink is None or self._sink.gate is None:
+            return 0.0
+        return self._sink.gate.dropped_samples / SAMPLE_RATE
+
+    @property
+    def manifest(self) -> SessionManifest:
+        if self._sink is None:
+            return SessionManifest(sample_rate=SAMPLE_RATE, audio_path=self.audio_path)
+        return SessionManifest(
+            sample_rate=SAMPLE_RATE, chunks=list(self._sink.chunks), audio_path=self.audio_path
+        )
+
+    def start(self) -> None:
+        """Start recording system audio in background thread."""
+        if self._recording:
+            return
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.audio_path.parent.mkdir(parents=True, exist_ok=True)
+        self._sink = SessionAudioStore(
+            self.audio_path,
+            chunk_samples=self.chunk_seconds * SAMPLE_RATE,
+            manifest_path=self.output_dir / SessionManifest.FILENAME,
+            on_chunk=self.on_chunk,
+            gate=SilenceGate() if self.silence_gate else None,
+        )
+        self._recording = True
+        self.finished.clear()
+        self._thread = threading.Thread(target=self._record_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> list[ChunkInfo]:
+        """Stop recording and return the session's chunks (ranges of audio_path)."""
+        self._recording = False
+        if self._thread:
+            self._thread.join(timeout=10)
+            self._thread = None
+        return self.chunks
+
+    def _record_loop(self) -> None:
+        try:
+            self._capture(self._sink)
+        finally:
+            self._sink.close()
+            self.finished.set()
+
+    @abc.abstractmethod
+    def _capture(self, sink: SessionAudioStore) -> None:
+        """Capture the whole session, feeding 16kHz mono blocks to sink while recording."""
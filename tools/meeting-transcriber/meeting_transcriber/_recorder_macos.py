@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-import threading
-import wave
-from pathlib import Path
+import queue
 
 import numpy as np
 import sounddevice as sd
 
-SAMPLE_RATE = 16000  # 16kHz mono for Whisper
-CHANNELS = 1
-CHUNK_DURATION_SEC = 300  # 5 minutes per chunk
+from ._audio import SAMPLE_RATE, BlockConverter, SessionAudioStore
+from ._recorder_base import BaseLoopbackRecorder
+
+BLOCK_QUEUE_SEC = 10  # Max audio held between the capture callback and the writer
 
 
 def _find_blackhole_device() -> int | None:
@@ -24,7 +23,7 @@ def _find_blackhole_device() -> int | None:
     return None
 
 
-class BlackHoleRecorder:
+class BlackHoleRecorder(BaseLoopbackRecorder):
     """Records system audio via BlackHole virtual audio device on macOS.
 
     Requires BlackHole (https://existential.audio/blackhole/) to be installed
@@ -32,38 +31,8 @@ class BlackHoleRecorder:
     system audio is routed to both speakers and BlackHole simultaneously.
     """
 
-    def __init__(self, output_dir: Path, chunk_seconds: int = CHUNK_DURATION_SEC):
-        self.output_dir = output_dir
-        self.chunk_seconds = chunk_seconds
-        self._recording = False
-        self._thread: threading.Thread | None = None
-        self._chunks: list[Path] = []
-        self._lock = threading.Lock()
-
-    @property
-    def chunks(self) -> list[Path]:
-        with self._lock:
-            return list(self._chunks)
-
-    def start(self) -> None:
-        """Start recording system audio in background thread."""
-        if self._recording:
-            return
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        self._recording = True
-        self._thread = threading.Thread(target=self._record_loop, daemon=True)
-        self._thread.start()
-
-    def stop(self) -> list[Path]:
-        """Stop recording and return list of chunk file paths."""
-        self._recording = False
-        if self._thread:
-            self._thread.join(timeout=10)
-            self._thread = None
-        return self.chunks
-
-    def _record_loop(self) -> None:
-        """Main recording loop — captures audio in chunks."""
+    def _capture(self, sink: SessionAudioStore) -> None:
+        """Capture the whole session on one stream, feeding converted blocks to the sink."""
         device_idx = _find_blackhole_device()
         if device_idx is None:
             print(
@@ -73,34 +42,42 @@ class BlackHoleRecorder:
             )
             return
 
-        chunk_idx = 0
-        while self._recording:
-            chunk_path = self.output_dir / f"chunk_{chunk_idx:04d}.wav"
-            self._record_chunk(device_idx, chunk_path)
-            with self._lock:
-                self._chunks.append(chunk_path)
-            chunk_idx += 1
-
-    def _record_chunk(self, device_idx: int, output_path: Path) -> None:
-        """Record a single chunk of audio to a WAV file."""
         device_info = sd.query_devices(device_idx)
         device_rate = int(device_info["default_samplerate"])
         device_channels = min(device_info["max_input_channels"], 2)
 
-        # Calculate total frames for this chunk
-        total_samples = device_rate * self.chunk_seconds
-
-        # Record the chunk (blocking, but we check _recording via callback)
-        frames_collected: list[np.ndarray] = []
-        samples_so_far = 0
+        # The audio callback only hands blocks over; conversion and disk writes
+        # happen on this thread. The bounded queue keeps memory flat. If the
+        # writer falls behind, blocks are dropped rather than stalling capture,
+        # and the next queued block carries the number of frames dropped
+        # before it, so the gap lands in the time map at the right place.
         block_size = 1024
+        blocks: queue.Queue[tuple[int, np.ndarray]] = queue.Queue(
+            maxsize=max(1, device_rate * BLOCK_QUEUE_SEC // block_size)
+        )
+        dropped = 0  # Device frames dropped since the last queued block
 
         def callback(indata, frames, time_info, status):
-            nonlocal samples_so_far
+            nonlocal dropped
             if not self._recording:
                 raise sd.CallbackAbort
-            frames_collected.append(indata.copy())
-            samples_so_far += frames
+            try:
+                blocks.put_nowait((dropped, indata.copy()))
+                dropped = 0
+            except queue.Full:
+                dropped += frames
+
+        converter = BlockConverter(device_rate, device_channels)
+        lost_frames = 0  # Device frames dropped so far, converted to 16kHz samples as a running total
+
+        def write(item: tuple[int, np.ndarray]) -> None:
+            nonlocal lost_frames
+            frames_dropped, block = item
+            if frames_dropped:
+                skipped = lost_frames * SAMPLE_RATE // device_rate
+                lost_frames += frames_dropped
+                sink.skip(lost_frames * SAMPLE_RATE // device_rate - skipped)
+            sink.write(converter.convert(block))
 
         try:
             with sd.InputStream(
@@ -111,34 +88,17 @@ class BlackHoleRecorder:
                 blocksize=block_size,
                 callback=callback,
             ):
-                # Wait until chunk duration reached or recording stopped
-                import time
-                while self._recording and samples_so_far < total_samples:
-                    time.sleep(0.1)
+                # Drain blocks until recording stopped; the sink rotates chunk files
+                while self._recording:
+                    try:
+                        write(blocks.get(timeout=0.1))
+                    except queue.Empty:
+                        continue
         except sd.CallbackAbort:
             pass
 
-        if not frames_collected:
-            return
-
-        # Concatenate all captured frames
-        samples = np.concatenate(frames_collected, axis=0)
-
-        # Downmix to mono if stereo
-        if device_channels > 1:
-            samples = samples.mean(axis=1).astype(np.int16)
-        else:
-            samples = samples.flatten()
-
-        # Resample to 16kHz if needed
-        if device_rate != SAMPLE_RATE:
-            num_output = int(len(samples) * SAMPLE_RATE / device_rate)
-            indices = np.linspace(0, len(samples) - 1, num_output).astype(int)
-            samples = samples[indices]
-
-        # Write WAV
-        with wave.open(str(output_path), "wb") as wf:
-            wf.setnchannels(CHANNELS)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(SAMPLE_RATE)
-            wf.writeframes(samples.tobytes())
+        # Flush whatever the callback queued before the stream closed
+        while not blocks.empty():
+            write(blocks.get_nowait())
+        if sink.lost_samples:
+            print(f"Warning: capture fell behind, dropped {sink.lost_samples / SAMPLE_RATE:.1f}s of audio")
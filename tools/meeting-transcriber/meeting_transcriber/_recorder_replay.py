@@ -0,0 +1,96 @@
+"""File-replay recorder — feeds existing WAV files through the recording pipeline."""
+
+from __future__ import annotations
+
+import time
+import wave
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from ._audio import BlockConverter, SessionAudioStore
+from ._recorder_base import BaseLoopbackRecorder, CHUNK_DURATION_SEC
+from .models import ChunkInfo
+
+REPLAY_BLOCK_SEC = 0.1
+
+
+class FileReplayRecorder(BaseLoopbackRecorder):
+    """Replays 16-bit PCM WAV files as if they were live system audio.
+
+    Uses the same conversion, silence gating, chunking and manifest code as the
+    device recorders, so the daemon pipeline can be exercised and benchmarked on
+    machines without audio hardware (e.g. Linux CI). Sources play back to back,
+    looping until duration_seconds of audio has been fed if it is set.
+
+    speed=1 replays in real time, speed=N at N× real time, speed=0 as fast as
+    the pipeline can consume it.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        sources: list[Path],
+        speed: float = 1.0,
+        duration_seconds: float | None = None,
+        chunk_seconds: int = CHUNK_DURATION_SEC,
+        on_chunk: Callable[[ChunkInfo], None] | None = None,
+        silence_gate: bool = False,
+        audio_path: Path | None = None,
+    ):
+        super().__init__(
+            output_dir,
+            chunk_seconds,
+            on_chunk=on_chunk,
+            silence_gate=silence_gate,
+            audio_path=audio_path,
+        )
+        if not sources:
+            raise ValueError("Replay needs at least one source WAV file")
+        self.sources = sources
+        self.speed = speed
+        self.duration_seconds = duration_seconds
+        self.audio_seconds = 0.0  # Source audio fed into the pipeline so far
+
+    def _capture(self, sink: SessionAudioStore) -> None:
+        started = time.monotonic()
+        while self._recording:
+            for source in self.sources:
+                if not self._replay_file(source, sink, started):
+                    return
+            if self.duration_seconds is None:
+                return
+
+    def _replay_file(self, source: Path, sink: SessionAudioStore, started: float) -> bool:
+        """Feed one file block by block. Returns False once replay should stop."""
+        with wave.open(str(source), "rb") as wf:
+            if wf.getsampwidth() != 2:
+                raise ValueError(f"Replay supports 16-bit PCM WAV only: {source}")
+            rate = wf.getframerate()
+            converter = BlockConverter(rate, min(wf.getnchannels(), 2))
+            channels = wf.getnchannels()
+            block_frames = max(1, int(rate * REPLAY_BLOCK_SEC))
+
+            while self._recording:
+                if self.duration_seconds is not None:
+                    remaining = self.duration_seconds - self.audio_seconds
+                    if remaining <= 0:
+                        return False
+                    block_frames = min(block_frames, max(1, int(remaining * rate)))
+
+                data = wf.readframes(block_frames)
+                if not data:
+                    return True
+                block = np.frombuffer(data, dtype=np.int16)
+                if channels > 2:
+                    block = block.reshape(-1, channels)[:, :2].reshape(-1)
+                sink.write(converter.convert(block))
+                self.audio_seconds += len(data) / (2 * channels * rate)
+
+                # Pace to N× real time
+                if self.speed > 0:
+                    ahead = self.audio_seconds / self.speed - (time.monotonic() - started)
+                    if ahead > 0:
+                        time.sleep(ahead)
+        return False
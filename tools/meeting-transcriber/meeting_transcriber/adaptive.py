@@ -0,0 +1,158 @@
+"""Adaptive model selection — trades accuracy for speed to keep the backlog bounded."""
+
+from __future__ import annotations
+
+import threading
+
+from .transcriber import MODEL_SIZES, WhisperTranscriber
+
+DEFAULT_TARGET_LATENCY_MINUTES = 15.0
+MAX_LIVE_RTF = 0.8  # Never step up to a setting that can't keep pace with live audio
+UPGRADE_HEADROOM = 0.5  # Step up only if the backlog would clear in half the target
+COOLDOWN_CHUNKS = 2  # Chunks to measure at a new setting before stepping up again
+EWMA_WEIGHT = 0.3
+
+# Rough decode cost relative to base at beam 1 — only used until a setting
+# has been measured on this machine
+_MODEL_COST = {"tiny": 0.5, "base": 1.0, "small": 2.5, "medium": 6.0, "large-v3": 12.0}
+_BEAM_COST_PER_EXTRA_BEAM = 0.12
+
+
+class AdaptivePolicy:
+    """Steps model size and beam size to keep transcription latency under a target.
+
+    The settings form a ladder from cheapest (min_model, min_beam) to most
+    accurate (max_model, max_beam); beam size moves first, then model size.
+    Transcribers report each chunk's audio and decode time through observe(),
+    which maintains a per-setting real-time factor (RTF). Submitted audio is
+    tracked with enqueue(), so the backlog covers every meeting still waiting
+    for transcription. Before each chunk, apply() moves one rung:
+
+    - down when backlog × RTF exceeds the target latency;
+    - up when the next rung would clear the backlog in half the target and
+      still run faster than real time.
+
+    Every switch is printed with the numbers that triggered it.
+    """
+
+    def __init__(
+        self,
+        min_model: str = "base",
+        max_model: str = "medium",
+        min_beam: int = 1,
+        max_beam: int = 5,
+        target_latency_seconds: float = DEFAULT_TARGET_LATENCY_MINUTES * 60,
+        start_model: str | None = None,
+    ):
+        for name in (min_model, max_model, start_model):
+            if name is not None and name not in MODEL_SIZES:
+                raise ValueError(f"Invalid model size: {name}. Choose from {MODEL_SIZES}")
+        lo, hi = MODEL_SIZES.index(min_model), MODEL_SIZES.index(max_model)
+        if lo > hi or not 1 <= min_beam <= max_beam:
+            raise ValueError("Adaptive bounds must satisfy min <= max (and beam >= 1)")
+        self.target_latency_seconds = target_latency_seconds
+        self.ladder = [
+            (model, beam)
+            for model in MODEL_SIZES[lo:hi + 1]
+            for beam in sorted({min_beam, (min_beam + max_beam) // 2, max_beam})
+        ]
+        # Start at the requested model with the widest beam, clamped to the bounds
+        start = start_model if start_model in MODEL_SIZES[lo:hi + 1] else min_model
+        self._rung = max(i for i, (m, _) in enumerate(self.ladder) if m == start)
+        self._rtf: dict[tuple[str, int], float] = {}
+        self._backlog_seconds = 0.0
+        self._since_switch = 0
+        self._lock = threading.Lock()
+
+    @property
+    def setting(self) -> tuple[str, int]:
+        """Current (model_size, beam_size)."""
+        with self._lock:
+            return self.ladder[self._rung]
+
+    @property
+    def backlog_seconds(self) -> float:
+        with self._lock:
+            return self._backlog_seconds
+
+    def enqueue(self, audio_seconds: float) -> None:
+        """Audio submitted for transcription."""
+        with self._lock:
+            self._backlog_seconds += audio_seconds
+
+    def observe(
+        self,
+        setting: tuple[str, int],
+        audio_seconds: float,
+        wall_seconds: float | None,
+    ) -> None:
+        """Record transcribed audio: removes it from the backlog and updates RTF.
+
+        wall_seconds=None only releases the backlog (e.g. the chunk failed).
+        """
+        with self._lock:
+            self._backlog_seconds = max(0.0, self._backlog_seconds - audio_seconds)
+            if wall_seconds is None or audio_seconds <= 0:
+                return
+            rtf = wall_seconds / audio_seconds
+            previous = self._rtf.get(setting)
+            self._rtf[setting] = rtf if previous is None else (
+                EWMA_WEIGHT * rtf + (1 - EWMA_WEIGHT) * previous
+            )
+            if setting == self.ladder[self._rung]:
+                self._since_switch += 1
+
+    def apply(self, transcriber: WhisperTranscriber) -> tuple[str, int]:
+        """Re-evaluate the setting and configure the transcriber with it."""
+        with self._lock:
+            self._step()
+            model, beam = self.ladder[self._rung]
+        transcriber.use_model(model)
+        transcriber.beam_size = beam
+        return model, beam
+
+    def _estimate(self, rung: int) -> float | None:
+        """Measured RTF for a rung, or one extrapolated from the closest measured rung."""
+        setting = self.ladder[rung]
+        if setting in self._rtf:
+            return self._rtf[setting]
+        if not self._rtf:
+            return None
+        (model, beam), rtf = min(
+            self._rtf.items(), key=lambda item: abs(self.ladder.index(item[0]) - rung)
+        )
+        return rtf * _cost(*setting) / _cost(model, beam)
+
+    def _step(self) -> None:
+        # Step down as soon as the new setting has been measured once; step up
+        # only after a few chunks, so a noisy chunk can't cause flapping
+        current = self._estimate(self._rung)
+        if current is None or self._since_switch < 1:
+            return
+        backlog = self._backlog_seconds
+        latency = backlog * current
+        if latency > self.target_latency_seconds and self._rung > 0:
+            self._switch(self._rung - 1, f"backlog would take {latency / 60:.1f} min")
+            return
+        if self._since_switch >= COOLDOWN_CHUNKS and self._rung + 1 < len(self.ladder):
+            upgraded = self._estimate(self._rung + 1)
+            if (
+                upgraded < MAX_LIVE_RTF
+                and backlog * upgraded < self.target_latency_seconds * UPGRADE_HEADROOM
+            ):
+                self._switch(self._rung + 1, f"headroom (est. RTF {upgraded:.2f})")
+
+    def _switch(self, rung: int, reason: str) -> None:
+        (old_model, old_beam), (model, beam) = self.ladder[self._rung], self.ladder[rung]
+        print(
+            f"Adaptive: {old_model}/beam {old_beam} → {model}/beam {beam} — {reason}; "
+            f"RTF {self._rtf.get((old_model, old_beam), 0):.2f}, "
+            f"backlog {self._backlog_seconds / 60:.1f} min "
+            f"(target {self.target_latency_seconds / 60:.0f} min)"
+        )
+        self._rung = rung
+        self._since_switch = 0
+
+
+def _cost(model: str, beam: int) -> float:
+    return _MODEL_COST[model] * (1 + _BEAM_COST_PER_EXTRA_BEAM * (beam - 1))
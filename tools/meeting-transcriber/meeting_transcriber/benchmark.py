@@ -0,0 +1,149 @@
+"""Benchmarks for choosing transcription settings per machine."""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from .transcriber import DEFAULT_BATCH_SIZE, ENGINES, WhisperTranscriber
+
+
+@dataclass
+class EngineResult:
+    """Timing for one engine on one audio file."""
+
+    engine: str
+    load_seconds: float
+    decode_seconds: float  # Best of the timed runs
+    audio_seconds: float
+    segments: int
+    words: int
+
+    @property
+    def speed(self) -> float:
+        """Audio seconds transcribed per wall-clock second (higher is faster)."""
+        return self.audio_seconds / self.decode_seconds if self.decode_seconds else 0.0
+
+
+@dataclass
+class MergeResult:
+    """Timing for assigning speakers to transcript segments on one synthetic timeline."""
+
+    turns: int
+    segments: int
+    sweep_seconds: float
+    scan_seconds: float | None  # Per-segment timeline scan; None when skipped (too slow)
+    identical: bool | None  # Sweep and scan agreed on every segment
+
+
+def audio_duration(path: Path) -> float:
+    """Duration in seconds — read from the header for WAV, decoded otherwise."""
+    if path.suffix.lower() == ".wav":
+        import wave
+        with wave.open(str(path), "rb") as wf:
+            return wf.getnframes() / wf.getframerate()
+    from faster_whisper import decode_audio
+    return len(decode_audio(str(path))) / 16000
+
+
+def bench_engines(
+    audio_path: Path,
+    model_size: str = "base",
+    engines: tuple[str, ...] = ENGINES,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    runs: int = 1,
+    language: str | None = None,
+) -> list[EngineResult]:
+    """Transcribe the same file with each engine and time it.
+
+    The transcript cache is not used. Each engine loads its own model so load
+    time is reported separately from decode time.
+    """
+    duration = audio_duration(audio_path)
+    results = []
+    for engine in engines:
+        transcriber = WhisperTranscriber(model_size=model_size, engine=engine, batch_size=batch_size)
+        started = time.perf_counter()
+        transcriber._load_model()
+        load_seconds = time.perf_counter() - started
+
+        best = float("inf")
+        segments = []
+        for _ in range(max(1, runs)):
+            started = time.perf_counter()
+            segments = transcriber.transcribe(audio_path, language=language)
+            best = min(best, time.perf_counter() - started)
+
+        results.append(EngineResult(
+            engine=engine,
+            load_seconds=load_seconds,
+            decode_seconds=best,
+            audio_seconds=duration,
+            segments=len(segments),
+            words=sum(len(s.text.split()) for s in segments),
+        ))
+    return results
+
+
+def synthetic_timeline(
+    turns: int,
+    speakers: int = 6,
+    seed: int = 0,
+) -> tuple[list[tuple[float, float, str]], list[tuple[float, float]]]:
+    """A diarization timeline of `turns` turns and transcript spans over the same audio.
+
+    Turns last 0.5-8 s with short gaps and occasional overlapping speech; spans
+    last 1-10 s, roughly what faster-whisper produces for conversation.
+    """
+    rng = random.Random(seed)
+    timeline = []
+    t = 0.0
+    for _ in range(turns):
+        start = max(0.0, t - rng.uniform(0, 1.0)) if rng.random() < 0.15 else t
+        end = start + rng.uniform(0.5, 8.0)
+        timeline.append((start, end, f"SPEAKER_{rng.randrange(speakers):02d}"))
+        t = end + rng.uniform(0, 1.5)
+    spans = []
+    s = 0.0
+    while s < t:
+        end = s + rng.uniform(1.0, 10.0)
+        spans.append((s, end))
+        s = end + rng.uniform(0, 0.5)
+    return timeline, spans
+
+
+def bench_speaker_merge(
+    turn_counts: tuple[int, ...] = (1_000, 10_000, 100_000, 1_000_000),
+    scan_limit: int = 10_000,
+) -> list[MergeResult]:
+    """Time the sweep-line speaker merge against the per-segment scan it replaced.
+
+    The scan is O(segments × turns), so it only runs up to scan_limit turns;
+    where it runs, both results are compared segment by segment.
+    """
+    from .diarizer import SpeakerDiarizer, _dominant_speakers
+
+    results = []
+    for turns in turn_counts:
+        timeline, spans = synthetic_timeline(turns)
+        started = time.perf_counter()
+        swept = _dominant_speakers(spans, timeline)
+        sweep_seconds = time.perf_counter() - started
+
+        scan_seconds = identical = None
+        if turns <= scan_limit:
+            started = time.perf_counter()
+            scanned = [SpeakerDiarizer._find_dominant_speaker(s, e, timeline) for s, e in spans]
+            scan_seconds = time.perf_counter() - started
+            identical = scanned == swept
+
+        results.append(MergeResult(
+            turns=turns,
+            segments=len(spans),
+            sweep_seconds=sweep_seconds,
+            scan_seconds=scan_seconds,
+            identical=identical,
+        ))
+    return results
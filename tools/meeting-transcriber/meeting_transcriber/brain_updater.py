@@ -6,10 +6,10 @@ action item routing for post-AI processing.
 
 from __future__ import annotations
 
-import re
 from datetime import datetime
 from pathlib import Path
 
+from .entities import load_entity_index
 from .models import MeetingInfo, TranscriptSegment, SpeakerSegment
 
 
@@ -25,63 +25,14 @@ class BrainUpdater:
 
     def __init__(self, brain_path: Path):
         self.brain_path = brain_path
-        self._entity_map: dict[str, dict] | None = None
 
     def _load_entity_map(self) -> dict[str, dict]:
-        """Parse ENTITY-INDEX.md into keyword → entity info lookup.
+        """Keyword → entity info lookup from ENTITY-INDEX.md.
 
         Returns dict mapping lowercase keywords to:
             {"name": str, "type": str, "folder": str}
         """
-        if self._entity_map is not None:
-            return self._entity_map
-
-        self._entity_map = {}
-        index_path = self.brain_path / "Operations" / "entity-watchdog" / "ENTITY-INDEX.md"
-        if not index_path.exists():
-            return self._entity_map
-
-        try:
-            content = index_path.read_text(encoding="utf-8")
-        except Exception:
-            return self._entity_map
-
-        for line in content.splitlines():
-            if not line.startswith("|") or "---" in line:
-                continue
-            parts = [p.strip() for p in line.split("|")]
-            if len(parts) < 4:
-                continue
-
-            name = parts[1]
-            entity_type = parts[2].lower() if len(parts) > 2 else ""
-            aliases_str = parts[3] if len(parts) > 3 else ""
-
-            # Skip header row
-            if not name or name.lower() in ("entity", "name", "entity name"):
-                continue
-
-            # Determine BB1 folder
-            type_folder_map = {
-                "client": "Clients",
-                "partner": "Partners",
-                "vendor": "Vendors",
-                "project": "Projects",
-            }
-            folder = type_folder_map.get(entity_type, "")
-
-            info = {"name": name, "type": entity_type, "folder": folder}
-
-            # Map the entity name
-            self._entity_map[name.lower()] = info
-
-            # Map aliases
-            for alias in aliases_str.split(","):
-                alias = alias.strip()
-                if alias and len(alias) > 2:
-                    self._entity_map[alias.lower()] = info
-
-        return self._entity_map
+        return load_entity_index(self.brain_path).entities
 
     def _detect_entity_slugs(
         self,
@@ -91,18 +42,12 @@ class BrainUpdater:
 
         Returns list of entity info dicts for matched entities.
         """
-        entity_map = self._load_entity_map()
-        if not entity_map:
+        index = load_entity_index(self.brain_path)
+        if not index:
             return []
 
         all_text = " ".join(seg.text for seg in segments).lower()
-
-        found: dict[str, dict] = {}  # entity name → info (deduplicated)
-        for keyword, info in entity_map.items():
-            if re.search(r"\b" + re.escape(keyword) + r"\b", all_text):
-                found[info["name"]] = info
-
-        return list(found.values())
+        return index.find_entities(all_text)
 
     def update_entity_histories(
         self,
@@ -8,6 +8,8 @@ import platform
 import sys
 from pathlib import Path
 
+STOP_WAIT_SEC = 10  # How often `stop` reports while the daemon finishes its current job
+
 
 def find_brain_path() -> Path | None:
     """Locate the brain folder."""
@@ -36,14 +38,32 @@ def cmd_daemon(args: list[str]) -> None:
     model = "base"
     language = None
     diarize = False
+    live_diarize = False
     hf_token = os.environ.get("HF_TOKEN")
     audio_retention_days = None  # Keep forever by default
+    model_idle_minutes = 30.0  # Unload an idle model after 30 minutes by default
+    silence_gate = True
+    chunk_seconds = 300
+    workers = 1
+    engine = "sequential"
+    batch_size = 16
+    beam_size = 5
+    adaptive = False
+    min_model, max_model = "base", "medium"
+    min_beam = 1
+    max_beam = None  # Defaults to --beam-size
+    target_latency_minutes = 15.0
+    refine_model = None
+    refine_threshold = -0.8
+    replay_sources: list[Path] = []
+    replay_speed = 1.0
+    replay_duration_seconds = None
 
     # Parse flags
     i = 0
     while i < len(args):
         if args[i] in ("--model", "-m") and i + 1 < len(args):
-            model = args[i + 1]
+            model = _parse_model(args[i + 1])
             i += 2
         elif args[i] in ("--language", "-l") and i + 1 < len(args):
             language = args[i + 1]
@@ -51,6 +71,9 @@ def cmd_daemon(args: list[str]) -> None:
         elif args[i] == "--diarize":
             diarize = True
             i += 1
+        elif args[i] == "--live-diarize":
+            live_diarize = True
+            i += 1
         elif args[i] == "--hf-token" and i + 1 < len(args):
             hf_token = args[i + 1]
             i += 2
@@ -64,9 +87,98 @@ def cmd_daemon(args: list[str]) -> None:
                 print(f"Error: --delete-audio-after requires an integer (days), got: {args[i + 1]}")
                 sys.exit(1)
             i += 2
+        elif args[i] == "--replay" and i + 1 < len(args):
+            replay_sources.append(Path(args[i + 1]))
+            i += 2
+        elif args[i] in ("--replay-speed", "--replay-duration") and i + 1 < len(args):
+            try:
+                value = float(args[i + 1])
+            except ValueError:
+                print(f"Error: {args[i]} requires a number, got: {args[i + 1]}")
+                sys.exit(1)
+            if args[i] == "--replay-speed":
+                replay_speed = value
+            else:
+                replay_duration_seconds = value * 60
+            i += 2
+        elif args[i] in ("--workers", "-w") and i + 1 < len(args):
+            workers = _parse_workers(args[i + 1])
+            i += 2
+        elif args[i] == "--engine" and i + 1 < len(args):
+            engine = _parse_engine(args[i + 1])
+            i += 2
+        elif args[i] == "--batch-size" and i + 1 < len(args):
+            batch_size = _parse_workers(args[i + 1], flag="--batch-size")
+            i += 2
+        elif args[i] in ("--beam-size", "--min-beam", "--max-beam") and i + 1 < len(args):
+            value = _parse_workers(args[i + 1], flag=args[i])
+            if args[i] == "--beam-size":
+                beam_size = value
+            elif args[i] == "--min-beam":
+                min_beam = value
+            else:
+                max_beam = value
+            i += 2
+        elif args[i] == "--chunk-seconds" and i + 1 < len(args):
+            chunk_seconds = _parse_workers(args[i + 1], flag="--chunk-seconds")
+            i += 2
+        elif args[i] == "--adaptive":
+            adaptive = True
+            i += 1
+        elif args[i] == "--min-model" and i + 1 < len(args):
+            min_model = args[i + 1]
+            i += 2
+        elif args[i] == "--max-model" and i + 1 < len(args):
+            max_model = args[i + 1]
+            i += 2
+        elif args[i] == "--refine-model" and i + 1 < len(args):
+            refine_model = _parse_model(args[i + 1], flag="--refine-model")
+            i += 2
+        elif args[i] == "--refine-threshold" and i + 1 < len(args):
+            refine_threshold = _parse_threshold(args[i + 1])
+            i += 2
+        elif args[i] == "--target-latency" and i + 1 < len(args):
+            try:
+                target_latency_minutes = float(args[i + 1])
+            except ValueError:
+                print(f"Error: --target-latency requires a number (minutes), got: {args[i + 1]}")
+                sys.exit(1)
+            i += 2
+        elif args[i] == "--keep-silence":
+            silence_gate = False
+            i += 1
+        elif args[i] == "--unload-model-after" and i + 1 < len(args):
+            try:
+                model_idle_minutes = float(args[i + 1])
+            except ValueError:
+                print(f"Error: --unload-model-after requires a number (minutes), got: {args[i + 1]}")
+                sys.exit(1)
+            i += 2
         else:
             i += 1
 
+    missing = [p for p in replay_sources if not p.exists()]
+    if missing:
+        print(f"Error: File not found: {missing[0]}")
+        sys.exit(1)
+
+    policy = None
+    if adaptive:
+        from .adaptive import AdaptivePolicy
+
+        try:
+            policy = AdaptivePolicy(
+                min_model=min_model,
+                max_model=max_model,
+                min_beam=min_beam,
+                max_beam=max_beam or beam_size,
+                target_latency_seconds=target_latency_minutes * 60,
+                start_model=model,
+            )
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
     from .daemon import MeetingDaemon
 
     daemon = MeetingDaemon(
@@ -74,16 +186,33 @@ def cmd_daemon(args: list[str]) -> None:
         model_size=model,
         language=language,
         diarize=diarize,
+        live_diarize=live_diarize,
         hf_token=hf_token,
         audio_retention_days=audio_retention_days,
+        model_idle_minutes=model_idle_minutes,
+        silence_gate=silence_gate,
+        chunk_seconds=chunk_seconds,
+        workers=workers,
+        engine=engine,
+        batch_size=batch_size,
+        beam_size=beam_size,
+        adaptive=policy,
+        refine_model=refine_model,
+        refine_threshold=refine_threshold,
+        replay_sources=replay_sources or None,
+        replay_speed=replay_speed,
+        replay_duration_seconds=replay_duration_seconds,
     )
     daemon.start()
 
 
 def cmd_transcribe(args: list[str]) -> None:
-    """Transcribe a specific audio file."""
+    """Transcribe a specific audio file, or every chunk of a recorded session folder."""
     if not args:
-        print("Usage: bizbrain-meetings transcribe <audio-file> [--model base]")
+        print(
+            "Usage: bizbrain-meetings transcribe <audio-file|session-dir> "
+            "[--model base] [--engine sequential|batched] [--workers N] [--refine-model large-v3] [--no-cache]"
+        )
         sys.exit(1)
 
     audio_path = Path(args[0])
@@ -92,14 +221,54 @@ def cmd_transcribe(args: list[str]) -> None:
         sys.exit(1)
 
     model = "base"
+    use_cache = True
+    workers = 1
+    engine = "sequential"
+    batch_size = 16
+    refine_model = None
+    refine_threshold = -0.8
     for i, arg in enumerate(args[1:], 1):
         if arg in ("--model", "-m") and i + 1 < len(args):
-            model = args[i + 1]
+            model = _parse_model(args[i + 1])
+        elif arg in ("--workers", "-w") and i + 1 < len(args):
+            workers = _parse_workers(args[i + 1])
+        elif arg == "--engine" and i + 1 < len(args):
+            engine = _parse_engine(args[i + 1])
+        elif arg == "--batch-size" and i + 1 < len(args):
+            batch_size = _parse_workers(args[i + 1], flag="--batch-size")
+        elif arg == "--refine-model" and i + 1 < len(args):
+            refine_model = _parse_model(args[i + 1], flag="--refine-model")
+        elif arg == "--refine-threshold" and i + 1 < len(args):
+            refine_threshold = _parse_threshold(args[i + 1])
+        elif arg == "--no-cache":
+            use_cache = False
 
     from .transcriber import WhisperTranscriber
+    from .transcript_cache import TranscriptCache
 
-    transcriber = WhisperTranscriber(model_size=model)
-    segments = transcriber.transcribe(audio_path)
+    cache = TranscriptCache(_transcript_cache_dir()) if use_cache else None
+    transcriber = WhisperTranscriber(
+        model_size=model,
+        cache=cache,
+        engine=engine,
+        batch_size=batch_size,
+        refine_model=refine_model,
+        refine_threshold=refine_threshold,
+    )
+    try:
+        if audio_path.is_dir():
+            from .language import LanguageLock
+            from .models import SessionManifest
+
+            manifest = SessionManifest.load(audio_path / SessionManifest.FILENAME)
+            chunks = manifest.chunks if manifest else sorted(audio_path.glob("chunk_*.wav"))
+            segments = transcriber.transcribe_chunks(chunks, workers=workers, lock=LanguageLock())
+        elif workers > 1:
+            segments = _transcribe_split(transcriber, audio_path, workers)
+        else:
+            segments = transcriber.transcribe(audio_path)
+    finally:
+        transcriber.close()
 
     for seg in segments:
         h = int(seg.start // 3600)
@@ -109,6 +278,127 @@ def cmd_transcribe(args: list[str]) -> None:
         print(f"[{ts}] {seg.text}")
 
 
+def _transcribe_split(transcriber, audio_path: Path, workers: int) -> list:
+    """Transcribe one file in parallel as pause-aligned ranges of it."""
+    from ._audio import SAMPLE_RATE, index_wav, read_wav_view
+    from .language import LanguageLock
+
+    try:
+        duration = len(read_wav_view(audio_path)) / SAMPLE_RATE
+    except ValueError:
+        print("Note: --workers splits only 16kHz mono WAV files — transcribing in one pass")
+        return transcriber.transcribe(audio_path)
+
+    # Two chunks per worker balances the load; keep chunks long enough for context
+    chunk_seconds = max(30.0, duration / (workers * 2))
+    chunks = index_wav(audio_path, chunk_seconds)
+    return transcriber.transcribe_chunks(chunks, workers=workers, lock=LanguageLock())
+
+
+def _parse_workers(value: str, flag: str = "--workers") -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        print(f"Error: {flag} requires a positive integer, got: {value}")
+        sys.exit(1)
+    return number
+
+
+def _parse_model(value: str, flag: str = "--model") -> str:
+    from .transcriber import MODEL_SIZES
+
+    if value not in MODEL_SIZES:
+        print(f"Error: {flag} must be one of {', '.join(MODEL_SIZES)}, got: {value}")
+        sys.exit(1)
+    return value
+
+
+def _parse_engine(value: str) -> str:
+    from .transcriber import ENGINES
+
+    if value not in ENGINES:
+        print(f"Error: --engine must be one of {', '.join(ENGINES)}, got: {value}")
+        sys.exit(1)
+    return value
+
+
+def _parse_threshold(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        print(f"Error: --refine-threshold requires a number (avg_logprob, e.g. -0.8), got: {value}")
+        sys.exit(1)
+
+
+def cmd_bench(args: list[str]) -> None:
+    """Compare the sequential and batched engines on an audio file."""
+    if args and args[0] == "--speaker-merge":
+        _bench_speaker_merge()
+        return
+    if not args:
+        print(
+            "Usage: bizbrain-meetings bench <audio-file> [--model base] "
+            "[--engines sequential,batched] [--batch-size 16] [--runs 1]\n"
+            "       bizbrain-meetings bench --speaker-merge"
+        )
+        sys.exit(1)
+
+    audio_path = Path(args[0])
+    if not audio_path.exists():
+        print(f"Error: File not found: {audio_path}")
+        sys.exit(1)
+
+    model = "base"
+    engines = ("sequential", "batched")
+    batch_size = 16
+    runs = 1
+    for i, arg in enumerate(args[1:], 1):
+        if arg in ("--model", "-m") and i + 1 < len(args):
+            model = _parse_model(args[i + 1])
+        elif arg == "--engines" and i + 1 < len(args):
+            engines = tuple(e.strip() for e in args[i + 1].split(","))
+        elif arg == "--batch-size" and i + 1 < len(args):
+            batch_size = _parse_workers(args[i + 1], flag="--batch-size")
+        elif arg == "--runs" and i + 1 < len(args):
+            runs = _parse_workers(args[i + 1], flag="--runs")
+
+    from .benchmark import bench_engines
+
+    print(f"Benchmarking {model} on {audio_path.name} (batch size {batch_size})...\n")
+    results = bench_engines(audio_path, model_size=model, engines=engines, batch_size=batch_size, runs=runs)
+
+    print(f"{'Engine':<12} {'Load':>7} {'Decode':>8} {'Speed':>8} {'Segments':>9} {'Words':>7}")
+    for r in results:
+        print(
+            f"{r.engine:<12} {r.load_seconds:>6.1f}s {r.decode_seconds:>7.1f}s "
+            f"{r.speed:>7.1f}x {r.segments:>9} {r.words:>7}"
+        )
+    fastest = max(results, key=lambda r: r.speed)
+    print(f"\nFastest on this machine: {fastest.engine} — use --engine {fastest.engine}")
+
+
+def _bench_speaker_merge() -> None:
+    """Time the diarization speaker merge on synthetic timelines of 1k-1M turns."""
+    from .benchmark import bench_speaker_merge
+
+    print("Benchmarking speaker merge on synthetic timelines...\n")
+    print(f"{'Turns':>9} {'Segments':>9} {'Sweep':>9} {'Scan':>9} {'Same':>5}")
+    for r in bench_speaker_merge():
+        scan = f"{r.scan_seconds:>8.2f}s" if r.scan_seconds is not None else f"{'—':>9}"
+        same = {True: "yes", False: "NO", None: "—"}[r.identical]
+        print(f"{r.turns:>9} {r.segments:>9} {r.sweep_seconds:>8.2f}s {scan} {same:>5}")
+
+
+def _transcript_cache_dir() -> Path:
+    """Brain-local transcript cache, or a per-user cache when no brain is set up."""
+    brain_path = find_brain_path()
+    if brain_path:
+        return brain_path / ".bizbrain" / "transcript-cache"
+    return Path.home() / ".cache" / "bizbrain-meetings" / "transcript-cache"
+
+
 def cmd_status(args: list[str]) -> None:
     """Show daemon status."""
     brain_path = find_brain_path()
@@ -127,6 +417,7 @@ def cmd_status(args: list[str]) -> None:
     print(f"Meeting active: {data.get('meeting_active', False)}")
     print(f"Chunks recorded: {data.get('chunks_recorded', 0)}")
     print(f"Chunks transcribed: {data.get('chunks_transcribed', 0)}")
+    print(f"Meetings awaiting post-processing: {data.get('jobs_pending', 0)}")
     print(f"Last check: {data.get('last_check', 'N/A')}")
 
     if data.get("current_meeting"):
@@ -136,6 +427,24 @@ def cmd_status(args: list[str]) -> None:
         print(f"  Title: {m.get('title')}")
         print(f"  Started: {m.get('started_at')}")
 
+    from .metrics import load_records, summarize
+
+    records = load_records(brain_path / ".bizbrain" / "meeting-metrics.jsonl")
+    if records:
+        print(f"\nStage metrics (last {len(records)} meeting(s), p50 / p90 / max):")
+        for stage, values in summarize(records).items():
+            wall = values.get("wall_seconds")
+            rtf = values.get("real_time_factor")
+            rss = values.get("peak_rss_mb")
+            line = f"  {stage:<14}"
+            if wall:
+                line += f" wall {wall[0]:.1f} / {wall[1]:.1f} / {wall[2]:.1f}s"
+            if rtf:
+                line += f"   RTF {rtf[0]:.3f} / {rtf[1]:.3f} / {rtf[2]:.3f}"
+            if rss:
+                line += f"   RSS {rss[0]:.0f} / {rss[1]:.0f} / {rss[2]:.0f} MB"
+            print(line)
+
 
 def cmd_stop(args: list[str]) -> None:
     """Stop the running daemon."""
@@ -150,16 +459,38 @@ def cmd_stop(args: list[str]) -> None:
         return
 
     try:
-        pid = int(pid_file.read_text().strip())
         import psutil
+    except ImportError:
+        print("Error stopping daemon: psutil is not installed")
+        return
+
+    try:
+        pid = int(pid_file.read_text().strip())
         proc = psutil.Process(pid)
         proc.terminate()
-        proc.wait(timeout=10)
-        print(f"Daemon (PID {pid}) stopped.")
-    except Exception as e:
+    except (ValueError, psutil.NoSuchProcess) as e:
+        # Unreadable PID or a process that is already gone — the file is stale
         print(f"Error stopping daemon: {e}")
         if pid_file.exists():
             pid_file.unlink()
+        return
+    except Exception as e:
+        print(f"Error stopping daemon: {e}")
+        return
+
+    # The daemon finishes the job in flight, then removes its own PID file.
+    # Never remove it while the process lives, or a new start could run a
+    # second daemon on the same job queue.
+    while True:
+        try:
+            proc.wait(timeout=STOP_WAIT_SEC)
+            break
+        except psutil.TimeoutExpired:
+            print(f"Waiting for the daemon (PID {pid}) to finish the job in progress...")
+    # Gone now — clear the PID file if the daemon died without removing it
+    if pid_file.exists() and pid_file.read_text().strip() == str(pid):
+        pid_file.unlink()
+    print(f"Daemon (PID {pid}) stopped.")
 
 
 def cmd_install(args: list[str]) -> None:
@@ -306,6 +637,7 @@ def cmd_setup(args: list[str]) -> None:
     else:
         print(f"  Warning: {current_platform} is not officially supported.")
         print("  Supported platforms: Windows (WASAPI), macOS (BlackHole)")
+        print("  Replay mode works everywhere: bizbrain-meetings daemon --replay <file.wav>")
 
     # Optional deps
     print("\nOptional (for speaker diarization):")
@@ -407,6 +739,7 @@ def _check_macos_deps(missing: list[str]) -> None:
 COMMANDS = {
     "daemon": cmd_daemon,
     "transcribe": cmd_transcribe,
+    "bench": cmd_bench,
     "status": cmd_status,
     "stop": cmd_stop,
     "setup": cmd_setup,
@@ -420,6 +753,7 @@ def main() -> None:
         print("\nCommands:")
         print("  daemon      Start the meeting transcription daemon")
         print("  transcribe  Transcribe a specific audio file")
+        print("  bench       Compare transcription engines on an audio file (--speaker-merge: diarization merge)")
         print("  status      Show daemon status")
         print("  stop        Stop the running daemon")
         print("  setup       Check prerequisites and show setup info")
@@ -428,8 +762,25 @@ def main() -> None:
         print("  --model tiny|base|small|medium|large-v3  Whisper model (default: base)")
         print("  --language en                            Force language (default: auto)")
         print("  --diarize                                Enable speaker diarization")
+        print("  --live-diarize                           Diarize each chunk during the meeting (implies --diarize)")
         print("  --keep-audio                             Keep recordings forever (default)")
         print("  --delete-audio-after N                   Delete audio chunks after N days")
+        print("  --engine sequential|batched              Decoding engine (default: sequential; see bench)")
+        print("  --batch-size N                           Batch size for the batched engine (default: 16)")
+        print("  --workers N                              Transcribe chunk backlogs in N processes (also for transcribe)")
+        print("  --beam-size N                            Beam search width (default: 5)")
+        print("  --refine-model SIZE                      Two-pass: re-decode low-confidence spans with SIZE (also for transcribe)")
+        print("  --refine-threshold X                     avg_logprob below which spans are re-decoded (default: -0.8)")
+        print("  --adaptive                               Step model/beam size to keep up with the backlog")
+        print("  --min-model / --max-model SIZE           Adaptive model bounds (default: base … medium)")
+        print("  --min-beam / --max-beam N                Adaptive beam bounds (default: 1 … --beam-size)")
+        print("  --target-latency MIN                     Adaptive backlog target (default: 15 minutes)")
+        print("  --keep-silence                           Record long silent stretches (default: skip them)")
+        print("  --chunk-seconds N                        Nominal chunk length; cut at the next pause (default: 300)")
+        print("  --replay FILE.wav                        Replay a recording as a simulated meeting, then exit")
+        print("  --replay-speed N                         Replay at N× real time (0 = as fast as possible)")
+        print("  --replay-duration MIN                    Loop replay sources until MIN minutes of audio")
+        print("  --unload-model-after N                   Unload idle Whisper model after N minutes (default: 30)")
         sys.exit(0)
 
     cmd = sys.argv[1]
@@ -5,17 +5,28 @@ from __future__ import annotations
 import os
 import signal
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 
 from .detector import detect_meeting, is_meeting_still_active, DetectedMeeting
 from .formatter import save_transcript
-from .models import DaemonStatus, MeetingInfo
-from .recorder import LoopbackRecorder
-from .transcriber import WhisperTranscriber
+from .adaptive import AdaptivePolicy
+from .jobs import JobQueue, JobWorker
+from .language import LanguageLock
+from .live import LiveTranscriptionWorker
+from .metrics import MeetingMetrics, StageTimer
+from .model_pool import DEFAULT_IDLE_MINUTES, WhisperModelPool
+from .models import ChunkInfo, DaemonStatus, MeetingInfo, MeetingJob, SessionManifest
+from .recorder import CHUNK_DURATION_SEC, FileReplayRecorder, LoopbackRecorder
+from .transcript_cache import TranscriptCache
+from .transcriber import WhisperTranscriber, resolve_chunks
 
 POLL_INTERVAL_SEC = 5  # How often to check for meetings
+REPLAY_POLL_INTERVAL_SEC = 0.5  # Replay runs end as soon as the source is exhausted
+STITCH_BLOCK_FRAMES = 16000 * 30  # Legacy chunk stitching copies 30 s at a time
+DIARIZATION_CPU_SHARE = 0.5  # Cores given to diarization while transcription finishes
 
 
 class MeetingDaemon:
@@ -23,9 +34,20 @@ class MeetingDaemon:
 
     Lifecycle:
         1. Poll detector every POLL_INTERVAL_SEC
-        2. When meeting detected → start loopback recorder
-        3. When meeting ends → stop recorder → transcribe chunks → save to brain
-        4. Optionally clean up old audio files based on retention policy
+        2. When meeting detected → start loopback recorder + live transcription worker
+        3. Each finished chunk is transcribed in the background while recording continues
+        4. When meeting ends → stop recorder → queue a post-processing job → resume polling
+        5. The job worker drains transcription, diarizes, saves to brain, and
+           optionally cleans up old audio files based on retention policy
+
+    Post-processing jobs live under .bizbrain/meeting-jobs/ until they finish,
+    so a meeting that starts right after another is still recorded, and jobs
+    interrupted by a crash or restart resume on the next start (re-transcription
+    is mostly transcript-cache hits).
+
+    With replay_sources set, detection is skipped: the WAV files are replayed as
+    one simulated meeting through the same pipeline, then the daemon exits and
+    reports throughput and peak memory.
     """
 
     def __init__(
@@ -34,24 +56,63 @@ class MeetingDaemon:
         model_size: str = "base",
         language: str | None = None,
         diarize: bool = False,
+        live_diarize: bool = False,
         hf_token: str | None = None,
         audio_retention_days: int | None = None,
+        model_idle_minutes: float | None = DEFAULT_IDLE_MINUTES,
+        silence_gate: bool = True,
+        chunk_seconds: int = CHUNK_DURATION_SEC,
+        workers: int = 1,
+        engine: str = "sequential",
+        batch_size: int = 16,
+        beam_size: int = 5,
+        adaptive: AdaptivePolicy | None = None,
+        refine_model: str | None = None,
+        refine_threshold: float = -0.8,
+        replay_sources: list[Path] | None = None,
+        replay_speed: float = 1.0,
+        replay_duration_seconds: float | None = None,
     ):
         self.brain_path = brain_path
         self.model_size = model_size
         self.language = language
-        self.diarize = diarize
+        self.diarize = diarize or live_diarize
+        self.live_diarize = live_diarize  # Diarize chunk by chunk during the meeting
         self.hf_token = hf_token
         self.audio_retention_days = audio_retention_days  # None = keep forever
+        self.model_pool = WhisperModelPool(idle_minutes=model_idle_minutes)  # None = never unload
+        self.silence_gate = silence_gate  # Drop long silent stretches while recording
+        self.chunk_seconds = chunk_seconds  # Nominal chunk length; cuts land on the next pause
+        self.workers = workers  # Worker processes for transcription backlogs
+        self.engine = engine  # "sequential" or "batched" decoding
+        self.batch_size = batch_size
+        self.beam_size = beam_size
+        self.adaptive = adaptive  # Steps model/beam size with backlog; None = fixed
+        self.refine_model = refine_model  # Two-pass: re-decode low-confidence spans
+        self.refine_threshold = refine_threshold
+        self.replay_sources = replay_sources  # Replay WAV files instead of live capture
+        self.replay_speed = replay_speed
+        self.replay_duration_seconds = replay_duration_seconds
 
         self._bizbrain_dir = brain_path / ".bizbrain"
         self._pid_file = self._bizbrain_dir / "meeting-daemon.pid"
+        self.transcript_cache = TranscriptCache(self._bizbrain_dir / "transcript-cache")
+        self._jobs = JobQueue(self._bizbrain_dir / "meeting-jobs")
+        self._job_worker = JobWorker(self._jobs, self._process_job, on_change=self._update_status)
         self._status_file = self._bizbrain_dir / "meeting-daemon-status.json"
+        self._metrics_file = self._bizbrain_dir / "meeting-metrics.jsonl"
         self._audio_dir = brain_path / "Operations" / "meetings" / "_audio"
         self._recordings_dir = brain_path / "Operations" / "meetings" / "recordings"
         self._running = False
         self._current_meeting: MeetingInfo | None = None
         self._recorder: LoopbackRecorder | None = None
+        self._live_worker: LiveTranscriptionWorker | None = None
+        self._diarizer = None  # SpeakerDiarizer, loaded on first use and kept
+        self._diarize_process = None  # DiarizationProcess, started on first use and kept
+        self._recording_timer: StageTimer | None = None
+        self._status_lock = threading.Lock()
+        self._replay_started: float | None = None
+        self._replay_audio_seconds = 0.0
 
     def start(self) -> None:
         """Start the daemon. Writes PID file and enters main loop."""
@@ -70,6 +131,14 @@ class MeetingDaemon:
             except (ValueError, ImportError):
                 pass
 
+        # Check the transcription settings before claiming the PID file, so an
+        # invalid model or engine can't leave a stale "running" status behind
+        try:
+            self._make_transcriber()
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
         # Write PID
         self._pid_file.write_text(str(os.getpid()))
         self._running = True
@@ -85,11 +154,30 @@ class MeetingDaemon:
         )
         self._update_status(running=True)
         print(f"Meeting daemon started (PID {os.getpid()}, model: {self.model_size})")
+        if self.refine_model:
+            print(
+                f"Two-pass: re-decoding segments below avg_logprob {self.refine_threshold:g} "
+                f"with {self.refine_model}"
+            )
+        if self.adaptive:
+            (low, _), (high, _) = self.adaptive.ladder[0], self.adaptive.ladder[-1]
+            print(
+                f"Adaptive model selection: {low} … {high}, "
+                f"target latency {self.adaptive.target_latency_seconds / 60:.0f} min"
+            )
         print(f"Brain: {self.brain_path}")
         print(f"Audio retention: {retention_msg}")
-        print("Listening for meetings...")
+        if self.replay_sources:
+            speed = f"{self.replay_speed:g}x real time" if self.replay_speed else "full speed"
+            print(f"Replaying {len(self.replay_sources)} file(s) at {speed}")
+        else:
+            print("Listening for meetings...")
 
         try:
+            # Load the model now so the first meeting doesn't pay the load cost
+            self._warm_up_model()
+            self.model_pool.start_reaper()
+            self._job_worker.start()
             self._main_loop()
         finally:
             self._cleanup()
@@ -103,23 +191,45 @@ class MeetingDaemon:
             try:
                 if self._current_meeting:
                     # Meeting in progress — check if it ended
-                    detected = detect_meeting()
+                    detected = self._detect()
                     if detected is None:
                         self._on_meeting_end()
                     else:
                         self._update_status(meeting_active=True)
                 else:
                     # No meeting — poll for one
-                    detected = detect_meeting()
+                    detected = self._detect()
                     if detected is not None:
                         self._on_meeting_start(detected)
             except Exception as e:
                 print(f"Error in main loop: {e}")
 
-            time.sleep(POLL_INTERVAL_SEC)
+            time.sleep(REPLAY_POLL_INTERVAL_SEC if self.replay_sources else POLL_INTERVAL_SEC)
+
+    def _detect(self) -> DetectedMeeting | None:
+        """Detect a meeting — or, in replay mode, report one until the replay ends."""
+        if not self.replay_sources:
+            return detect_meeting()
+        if self._current_meeting is None:
+            if self._replay_started is not None:
+                return None  # Replay already ran — one simulated meeting per daemon
+            self._replay_started = time.monotonic()
+        elif self._recorder is not None and self._recorder.finished.is_set():
+            return None
+        name = self.replay_sources[0].stem
+        return DetectedMeeting(
+            platform="replay",
+            process_name="replay",
+            window_title=f"Replay {name}",
+            pid=os.getpid(),
+        )
 
     def _on_meeting_start(self, detected: DetectedMeeting) -> None:
         """Called when a new meeting is detected."""
+        # Build the transcriber first: if its settings are invalid, no meeting
+        # state has been set and the daemon stays idle
+        transcriber = self._make_transcriber()
+
         now = datetime.now()
         self._current_meeting = MeetingInfo(
             platform=detected.platform,
@@ -127,95 +237,339 @@ class MeetingDaemon:
             started_at=now,
             process_name=detected.process_name,
             window_title=detected.window_title,
+            language=self.language,
+        )
+
+        # Transcribe chunks in the background as soon as the recorder finalizes them
+        self._live_worker = LiveTranscriptionWorker(
+            transcriber,
+            language=self.language,
+            on_progress=lambda done: self._update_status(),
+            workers=self.workers,
+            metrics=MeetingMetrics(),
+            policy=self.adaptive,
+            lock=None if self.language else LanguageLock(),
+            diarizer=self._incremental_diarizer(),
         )
+        self._live_worker.start()
 
-        # Start recording to a session-specific audio directory
+        # Re-load in the background if the model was unloaded while idle
+        self._warm_up_model()
+
+        # Record straight into the permanent recording; the session directory
+        # only holds the chunk index
         session_dir = self._audio_dir / now.strftime("%Y-%m-%d_%H%M%S")
-        self._recorder = LoopbackRecorder(session_dir)
+        recording_path = self._recording_path(self._current_meeting)
+        self._current_meeting.recording_path = recording_path
+        if self.replay_sources:
+            self._recorder = FileReplayRecorder(
+                session_dir,
+                sources=self.replay_sources,
+                speed=self.replay_speed,
+                duration_seconds=self.replay_duration_seconds,
+                chunk_seconds=self.chunk_seconds,
+                on_chunk=self._live_worker.submit,
+                silence_gate=self.silence_gate,
+                audio_path=recording_path,
+            )
+        else:
+            self._recorder = LoopbackRecorder(
+                session_dir,
+                chunk_seconds=self.chunk_seconds,
+                on_chunk=self._live_worker.submit,
+                silence_gate=self.silence_gate,
+                audio_path=recording_path,
+            )
+        self._recording_timer = StageTimer().start()
         self._recorder.start()
 
         print(f"\nMeeting detected: {detected.platform} — {detected.window_title}")
-        print(f"Recording to: {session_dir}")
+        print(f"Recording to: {recording_path}")
         self._update_status(meeting_active=True)
 
     def _on_meeting_end(self) -> None:
-        """Called when the active meeting ends."""
+        """Called when the active meeting ends — hands it to the job worker and returns."""
         if not self._current_meeting or not self._recorder:
             return
 
-        self._current_meeting.ended_at = datetime.now()
-        print(f"\nMeeting ended ({self._current_meeting.duration_minutes:.0f} min)")
-
-        # Stop recording
-        chunk_paths = self._recorder.stop()
-        self._current_meeting.audio_chunks = chunk_paths
-        print(f"Recorded {len(chunk_paths)} audio chunk(s)")
-
-        if not chunk_paths:
+        meeting = self._current_meeting
+        meeting.ended_at = datetime.now()
+        print(f"\nMeeting ended ({meeting.duration_minutes:.0f} min)")
+
+        # Stop recording — the final chunk is handed to the live worker on the way out
+        chunks = self._recorder.stop()
+        meeting.audio_chunks = [meeting.recording_path] if chunks else []
+        metrics = self._live_worker.metrics
+        metrics.add("recording", *self._recording_timer.stop())
+        manifest = self._recorder.manifest
+        metrics.audio_seconds = (
+            manifest.total_samples / manifest.sample_rate + self._recorder.dropped_seconds
+        )
+        print(f"Recorded {len(chunks)} audio chunk(s)")
+        if self._recorder.dropped_seconds:
+            print(f"Skipped {self._recorder.dropped_seconds / 60:.1f} min of silence")
+        if self.replay_sources:
+            self._replay_audio_seconds = self._recorder.audio_seconds
+            self._running = False
+
+        if chunks:
+            # The live worker keeps transcribing its remaining chunks inside the job
+            job = MeetingJob(
+                meeting=meeting, session_dir=self._recorder.output_dir, metrics=metrics.to_dict()
+            )
+            self._job_worker.submit(job, self._live_worker)
+            print(f"Queued post-processing: {job.id}")
+        else:
             print("No audio recorded — skipping transcription")
-            self._current_meeting = None
-            self._recorder = None
-            self._update_status(meeting_active=False)
-            return
+            if self._live_worker:
+                self._live_worker.finish()
 
-        # Stitch chunks into a single permanent recording
-        recording_path = self._stitch_recording(chunk_paths)
-        if recording_path:
-            self._current_meeting.recording_path = recording_path
-            print(f"Recording saved: {recording_path}")
+        # Reset state — the next meeting can start recording right away
+        self._current_meeting = None
+        self._recorder = None
+        self._recording_timer = None
+        self._live_worker = None
+        self._update_status(meeting_active=False)
 
-        # Transcribe
-        print(f"Transcribing with {self.model_size} model...")
-        transcriber = WhisperTranscriber(model_size=self.model_size)
-        segments = transcriber.transcribe_chunks(chunk_paths, language=self.language)
+    def _process_job(self, job: MeetingJob, live_worker: LiveTranscriptionWorker | None) -> None:
+        """Post-process one ended meeting: transcribe, diarize, save, update brain.
+
+        live_worker is the meeting's live transcription worker, or None when the
+        job was resumed from disk; then every chunk is transcribed again.
+        Sessions recorded before the single-file store have per-chunk files,
+        which are stitched into a permanent recording first. Full-meeting
+        diarization runs in its own process while transcription finishes, with
+        the cores split between them, and is merged in once both are done. Each
+        stage is timed; the metrics go to .bizbrain/meeting-metrics.jsonl and
+        the transcript's .meta.json sidecar.
+        """
+        meeting = job.meeting
+        metrics = live_worker.metrics if live_worker else MeetingMetrics.from_dict(job.metrics)
+        manifest = SessionManifest.load(job.session_dir / SessionManifest.FILENAME)
+        chunks = manifest.chunks if manifest else resolve_chunks(meeting.audio_chunks)
+        chunks = [c for c in chunks if c.path.exists()]
+        if not chunks:
+            print(f"No audio left for {job.id} — dropping job")
+            if live_worker:
+                live_worker.finish()
+            return
+        chunk_paths = list(dict.fromkeys(c.path for c in chunks))
+
+        # Legacy sessions: stitch per-chunk files into a single permanent recording
+        if not (meeting.recording_path and meeting.recording_path.exists()):
+            with metrics.stage("stitching"):
+                recording_path = self._stitch_recording(meeting, chunk_paths)
+            if recording_path:
+                meeting.recording_path = recording_path
+                self._jobs.update(job)
+                print(f"Recording saved: {recording_path}")
+
+        # Diarize the full meeting alongside transcription, unless the live
+        # worker is diarizing chunk by chunk
+        live_diarizer = live_worker.diarizer if live_worker else None
+        diarization = None
+        transcription_cores = None
+        if self.diarize and not (live_diarizer and not live_diarizer.failed):
+            diarization = self._start_diarization(chunks)
+            if diarization is not None:
+                transcription_cores = max(1, (os.cpu_count() or 1) - self._diarize_process.threads)
+
+        # Wait for the live worker to finish the remaining chunk(s)
+        transcriber = live_worker.transcriber if live_worker else self._make_transcriber()
+        try:
+            if live_worker:
+                lock = live_worker.lock
+                print(f"Finishing live transcription ({transcriber.model_size} model)...")
+                segments = live_worker.finish()
+                if live_worker.failed:
+                    print(f"Re-transcribing all chunks ({len(live_worker.failed)} failed live)...")
+                    transcriber.cpu_budget = transcription_cores
+                    with metrics.stage("transcription"):
+                        segments = transcriber.transcribe_chunks(
+                            chunks, language=self.language, workers=self.workers, lock=lock
+                        )
+            else:
+                # Start from the language detected before the restart, if any
+                lock = None if self.language else LanguageLock(meeting.language)
+                print(f"Transcribing {len(chunks)} chunk(s) for resumed job {job.id}...")
+                transcriber.cpu_budget = transcription_cores
+                audio = sum(c.duration_seconds for c in chunks)
+                if self.adaptive:
+                    self.adaptive.enqueue(audio)
+                    setting = self.adaptive.apply(transcriber)
+                started, wall = time.perf_counter(), None
+                try:
+                    with metrics.stage("transcription"):
+                        segments = transcriber.transcribe_chunks(
+                            chunks, language=self.language, workers=self.workers, lock=lock
+                        )
+                    wall = time.perf_counter() - started
+                finally:
+                    if self.adaptive:
+                        self.adaptive.observe(setting, audio, wall)
+        finally:
+            transcriber.close()  # The meeting's worker pool isn't needed past this point
+        if lock is not None and lock.language:
+            meeting.language = lock.language
         print(f"Transcribed {len(segments)} segments")
 
-        # Optional diarization — now uses full meeting audio
+        # Optional diarization — join the live or full-meeting speaker timeline
         if self.diarize:
             try:
-                from .diarizer import SpeakerDiarizer, DIARIZATION_AVAILABLE
-                if DIARIZATION_AVAILABLE:
-                    print("Running speaker diarization (full meeting)...")
-                    diarizer = SpeakerDiarizer(hf_token=self.hf_token)
-                    segments = diarizer.diarize_full_meeting(chunk_paths, segments)
+                if live_diarizer and live_diarizer.complete(chunks):
+                    print("Assigning speakers from live diarization...")
+                    with metrics.stage("diarization"):
+                        segments = live_diarizer.merge(segments)
+                else:
+                    if diarization is None:
+                        diarization = self._start_diarization(chunks)
+                    if diarization is not None:
+                        from .diarizer import _merge_speakers
+                        timeline, timing = diarization.result()
+                        metrics.add("diarization", *timing)
+                        segments = _merge_speakers(segments, timeline)
+                if live_diarizer or diarization is not None:
                     speakers = {s.speaker for s in segments}
                     print(f"Identified speakers: {speakers}")
             except Exception as e:
+                from concurrent.futures.process import BrokenProcessPool
+                if isinstance(e, BrokenProcessPool):
+                    self._reset_diarize_process()
                 print(f"Diarization failed (continuing without): {e}")
 
         # Save transcript to brain
-        transcript_path = save_transcript(
-            self.brain_path, self._current_meeting, segments
-        )
-        self._current_meeting.transcript_path = transcript_path
+        with metrics.stage("formatting"):
+            transcript_path = save_transcript(self.brain_path, meeting, segments)
+        meeting.transcript_path = transcript_path
         print(f"Transcript saved: {transcript_path}")
 
-        # Proactive BB1 brain updates (entity history)
-        try:
-            from .brain_updater import BrainUpdater
-            updater = BrainUpdater(self.brain_path)
-            updated = updater.update_entity_histories(self._current_meeting, segments)
-            if updated:
-                print(f"Updated entity histories: {', '.join(updated)}")
-        except Exception as e:
-            print(f"Brain update skipped: {e}")
+        # Proactive BB1 brain updates (entity history) — appends, so run at most once
+        if job.stage != "saved":
+            job.stage = "saved"
+            self._jobs.update(job)
+            try:
+                from .brain_updater import BrainUpdater
+                updater = BrainUpdater(self.brain_path)
+                with metrics.stage("entities"):
+                    updated = updater.update_entity_histories(meeting, segments)
+                if updated:
+                    print(f"Updated entity histories: {', '.join(updated)}")
+            except Exception as e:
+                print(f"Brain update skipped: {e}")
+
+        self._save_metrics(job, metrics, transcript_path)
 
         # Clean up old audio (if retention policy set)
         self._cleanup_old_audio()
 
-        # Reset state
-        self._current_meeting = None
-        self._recorder = None
-        self._update_status(meeting_active=False)
+    def _save_metrics(self, job: MeetingJob, metrics: MeetingMetrics, transcript_path: Path) -> None:
+        """Log a meeting's stage metrics and add them to its metadata sidecar."""
+        try:
+            metrics.append_record(self._metrics_file, job.id, job.meeting.title)
+            metrics.write_to_sidecar(transcript_path.with_suffix(".meta.json"))
+        except Exception as e:
+            print(f"Could not save meeting metrics: {e}")
+            return
+        stages = metrics.to_dict()["stages"]
+        print("Stage times: " + ", ".join(
+            f"{name} {s['wall_seconds']:.1f}s" for name, s in stages.items()
+        ))
+
+    def _report_replay(self) -> None:
+        """Print end-to-end throughput and peak memory for a replay run."""
+        wall = time.monotonic() - self._replay_started
+        audio = self._replay_audio_seconds
+        print(
+            f"Replay finished: {audio / 60:.1f} min of audio in {wall:.1f}s "
+            f"({audio / wall:.1f}x real time), peak RSS {_peak_rss_mb():.0f} MB"
+        )
 
-    def _stitch_recording(self, chunk_paths: list[Path]) -> Path | None:
+    def _start_diarization(self, chunks: list[ChunkInfo]):
+        """Submit full-meeting diarization to the diarization process.
+
+        Returns a Future of (speaker timeline, stage timing), or None without pyannote.
+        """
+        from .diarizer import DIARIZATION_AVAILABLE, DiarizationProcess
+        if not DIARIZATION_AVAILABLE:
+            return None
+        cores = os.cpu_count() or 1
+        try:
+            if self._diarize_process is None:
+                threads = max(1, round(cores * DIARIZATION_CPU_SHARE))
+                self._diarize_process = DiarizationProcess(self.hf_token, threads=threads)
+            future = self._diarize_process.submit(chunks)
+        except Exception as e:
+            # A broken pool (worker crashed or was OOM-killed) rejects every
+            # submit — drop it so the next meeting starts a fresh one
+            print(f"Diarization unavailable (continuing without): {e}")
+            self._reset_diarize_process()
+            return None
+        print(
+            f"Running speaker diarization (full meeting) alongside transcription "
+            f"({self._diarize_process.threads} of {cores} cores)..."
+        )
+        return future
+
+    def _reset_diarize_process(self) -> None:
+        """Shut down the diarization process; the next meeting starts a new one."""
+        if self._diarize_process is None:
+            return
+        try:
+            self._diarize_process.shutdown()
+        except Exception:
+            pass  # Already broken
+        self._diarize_process = None
+
+    def _speaker_diarizer(self):
+        """The daemon's SpeakerDiarizer — the pyannote pipeline is loaded once and reused."""
+        if self._diarizer is None:
+            from .diarizer import SpeakerDiarizer
+            self._diarizer = SpeakerDiarizer(hf_token=self.hf_token)
+        return self._diarizer
+
+    def _incremental_diarizer(self):
+        """A fresh IncrementalDiarizer for live diarization, or None when it is off or unavailable."""
+        if not self.live_diarize:
+            return None
+        try:
+            from .diarizer import IncrementalDiarizer
+            return IncrementalDiarizer(self._speaker_diarizer())
+        except Exception as e:
+            print(f"Live diarization unavailable (diarizing after the meeting): {e}")
+            return None
+
+    def _make_transcriber(self) -> WhisperTranscriber:
+        return WhisperTranscriber(
+            model_size=self.model_size,
+            pool=self.model_pool,
+            cache=self.transcript_cache,
+            engine=self.engine,
+            batch_size=self.batch_size,
+            beam_size=self.beam_size,
+            refine_model=self.refine_model,
+            refine_threshold=self.refine_threshold,
+        )
+
+    def _warm_up_model(self) -> None:
+        model_size = self.adaptive.setting[0] if self.adaptive else self.model_size
+        probe = WhisperTranscriber(model_size=model_size)
+        self.model_pool.warm_up(probe.model_size, probe.device, probe.compute_type)
+
+    def _recording_path(self, meeting: MeetingInfo) -> Path:
+        """Permanent recording path for a meeting — never an existing file."""
+        date_str = meeting.started_at.strftime("%Y-%m-%d")
+        recording_path = self._recordings_dir / f"{date_str}-{meeting.slug}.wav"
+        if recording_path.exists():
+            time_str = meeting.started_at.strftime("%H%M%S")
+            recording_path = recording_path.with_name(f"{date_str}-{meeting.slug}-{time_str}.wav")
+        return recording_path
+
+    def _stitch_recording(self, meeting: MeetingInfo, chunk_paths: list[Path]) -> Path | None:
         """Stitch audio chunks into a single clean WAV file for permanent storage."""
         if not chunk_paths:
             return None
 
-        date_str = self._current_meeting.started_at.strftime("%Y-%m-%d")
-        slug = self._current_meeting.slug
-        recording_path = self._recordings_dir / f"{date_str}-{slug}.wav"
+        recording_path = self._recording_path(meeting)
 
         try:
             from .diarizer import _stitch_wav_files
@@ -231,30 +585,41 @@ class MeetingDaemon:
                 return None
 
     def _cleanup_old_audio(self) -> None:
-        """Delete audio chunks older than retention period.
+        """Delete session directories (chunk indexes, legacy chunk files) older than retention period.
 
-        When audio_retention_days is None, audio is kept forever.
+        When audio_retention_days is None, they are kept forever. Recordings
+        under Operations/meetings/recordings are permanent and never deleted here.
         """
         if self.audio_retention_days is None:
             return
         if not self._audio_dir.exists():
             return
         cutoff = time.time() - (self.audio_retention_days * 86400)
+        queued = {job.session_dir.name for job in self._jobs.pending()}
         for session_dir in self._audio_dir.iterdir():
+            if session_dir.name in queued:
+                continue  # Still waiting for post-processing
             if session_dir.is_dir() and session_dir.stat().st_mtime < cutoff:
                 for f in session_dir.iterdir():
                     f.unlink()
                 session_dir.rmdir()
 
     def _update_status(self, **kwargs) -> None:
-        status = DaemonStatus.load(self._status_file)
-        status.pid = os.getpid()
-        status.last_check = datetime.now().isoformat()
-        for k, v in kwargs.items():
-            setattr(status, k, v)
-        if self._recorder:
-            status.chunks_recorded = len(self._recorder.chunks)
-        status.save(self._status_file)
+        # Called from the main loop, the job worker and the live transcription
+        # thread — snapshot the meeting state, which the main loop may reset
+        recorder, live_worker = self._recorder, self._live_worker
+        with self._status_lock:
+            status = DaemonStatus.load(self._status_file)
+            status.pid = os.getpid()
+            status.last_check = datetime.now().isoformat()
+            for k, v in kwargs.items():
+                setattr(status, k, v)
+            if recorder:
+                status.chunks_recorded = len(recorder.chunks)
+            if live_worker:
+                status.chunks_transcribed = live_worker.chunks_transcribed
+            status.jobs_pending = len(self._jobs.pending())
+            status.save(self._status_file)
 
     def _handle_signal(self, signum, frame) -> None:
         print(f"\nReceived signal {signum} — stopping...")
@@ -268,12 +633,36 @@ class MeetingDaemon:
         elif self._recorder:
             # No active meeting but recorder running — just stop it
             self._recorder.stop()
+        # Only a replay waits for every job; otherwise the job in flight finishes
+        # and the rest stay queued on disk, resuming on the next start
+        drain = bool(self.replay_sources)
+        pending = len(self._jobs.pending())
+        if pending and drain:
+            print(f"Finishing post-processing for {pending} meeting(s)...")
+        elif pending:
+            print(f"Leaving {pending} meeting job(s) queued for the next start")
+        self._job_worker.stop(drain=drain)
+        self._reset_diarize_process()
+        if self.replay_sources and self._replay_started is not None:
+            self._report_replay()
+        self.model_pool.stop()
         if self._pid_file.exists():
             self._pid_file.unlink()
         self._update_status(running=False, meeting_active=False)
         print("Daemon stopped.")
 
 
+def _peak_rss_mb() -> float:
+    """Peak resident memory of this process in MB (0 where unsupported)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
 def _stitch_wav_chunks(chunk_paths: list[Path], output_path: Path) -> None:
     """Concatenate WAV chunks into a single file (standalone fallback)."""
     import wave
@@ -289,4 +678,5 @@ def _stitch_wav_chunks(chunk_paths: list[Path], output_path: Path) -> None:
         out.setparams(params)
         for chunk_path in valid_paths:
             with wave.open(str(chunk_path), "rb") as chunk:
-                out.writeframes(chunk.readframes(chunk.getnframes()))
+                while frames := chunk.readframes(STITCH_BLOCK_FRAMES):
+                    out.writeframes(frames)
@@ -6,13 +6,21 @@ Also requires a HuggingFace token with access to pyannote models.
 
 from __future__ import annotations
 
-import tempfile
+import heapq
+import threading
 import wave
 from pathlib import Path
 
 import numpy as np
 
-from .models import TranscriptSegment, SpeakerSegment
+from ._audio import SAMPLE_RATE, read_chunk
+from .metrics import StageTimer
+from .models import ChunkInfo, SessionManifest, TranscriptSegment, SpeakerSegment
+from .transcriber import resolve_chunks
+
+STITCH_BLOCK_FRAMES = SAMPLE_RATE * 30  # Copy 30 s at a time when stitching legacy chunks
+CLUSTER_THRESHOLD = 0.5  # Cosine similarity a chunk's speaker needs to join a meeting speaker
+MIN_NEW_SPEAKER_SECONDS = 2.0  # Less speech than this joins the closest speaker instead
 
 DIARIZATION_AVAILABLE = False
 try:
@@ -64,16 +72,11 @@ class SpeakerDiarizer:
 
     def diarize_full_meeting(
         self,
-        chunk_paths: list[Path],
+        chunks: list[ChunkInfo] | list[Path],
         segments: list[TranscriptSegment],
-        tmp_dir: Path | None = None,
     ) -> list[SpeakerSegment]:
-        """Stitch all audio chunks and run diarization on the full meeting.
-
-        Fixes the single-chunk diarization bug by concatenating all WAV chunks
-        into one temp file, running pyannote on the complete audio, then cleaning up.
-        """
-        if not chunk_paths:
+        """Run diarization on the full meeting and assign speakers to the transcript."""
+        if not chunks:
             return [
                 SpeakerSegment(
                     start=s.start, end=s.end, text=s.text,
@@ -81,32 +84,34 @@ class SpeakerDiarizer:
                 )
                 for s in segments
             ]
+        return _merge_speakers(segments, self.diarize_timeline(chunks))
 
-        # Single chunk — no stitching needed
-        if len(chunk_paths) == 1:
-            return self.diarize_and_merge(chunk_paths[0], segments)
+    def diarize_timeline(self, chunks: list[ChunkInfo] | list[Path]) -> list[tuple[float, float, str]]:
+        """Speaker timeline of the full meeting, in meeting time.
+
+        The chunks are assembled into one in-memory waveform (float32, about
+        230 MB per hour) straight from their memory-mapped samples and handed
+        to pyannote as a {"waveform", "sample_rate"} mapping — no temp files and
+        no second decode. The waveform size and peak memory are printed.
+        """
+        # Transcript segments are in meeting time; the recorded audio may be
+        # shorter if the recorder dropped silence, so map the timeline back
+        manifest = SessionManifest(chunks=resolve_chunks(chunks))
+        if not manifest.chunks:
+            return []
 
-        # Stitch all chunks into a single temp WAV
         self._load_pipeline()
-        cleanup_tmp_dir = tmp_dir is None
-        if tmp_dir is None:
-            tmp_dir = Path(tempfile.mkdtemp(prefix="bizbrain-diarize-"))
+        timer = StageTimer().start()
+        waveform = _load_waveform(manifest.chunks)
+        diarization = self._pipeline(_pipeline_input(waveform))
+        _, _, peak_rss_mb = timer.stop()
+        print(
+            f"Diarized {len(waveform) / SAMPLE_RATE / 60:.1f} min: "
+            f"waveform {waveform.nbytes / (1024 * 1024):.0f} MB, peak RSS {peak_rss_mb:.0f} MB"
+        )
+        del waveform
 
-        stitched_path = tmp_dir / "full_meeting.wav"
-        try:
-            _stitch_wav_files(chunk_paths, stitched_path)
-            diarization = self._pipeline(str(stitched_path))
-            speaker_timeline = _build_speaker_timeline(diarization)
-            return _merge_speakers(segments, speaker_timeline)
-        finally:
-            # Clean up temp file
-            if stitched_path.exists():
-                stitched_path.unlink()
-            if cleanup_tmp_dir and tmp_dir.exists():
-                try:
-                    tmp_dir.rmdir()
-                except OSError:
-                    pass
+        return _to_session_timeline(_build_speaker_timeline(diarization), manifest)
 
     @staticmethod
     def _find_dominant_speaker(
@@ -127,6 +132,219 @@ class SpeakerDiarizer:
         return max(overlap, key=overlap.get)
 
 
+class SpeakerClusters:
+    """Online cosine clustering of per-chunk speaker embeddings into meeting speakers.
+
+    Each meeting speaker is the duration-weighted mean of the embeddings
+    assigned to it. A chunk's speakers are matched greedily, most similar pair
+    first, and never two to the same meeting speaker. A speaker with no match
+    above threshold starts a new meeting speaker — unless it spoke for less
+    than MIN_NEW_SPEAKER_SECONDS, whose embedding is too noisy to trust; it
+    joins the closest speaker without moving its centroid. Memory is one
+    centroid per speaker, however long the meeting.
+    """
+
+    def __init__(self, threshold: float = CLUSTER_THRESHOLD):
+        self.threshold = threshold
+        self._centroids: list[np.ndarray] = []  # Unnormalized weighted sums
+        self._weights: list[float] = []
+
+    @property
+    def labels(self) -> list[str]:
+        return [_speaker_label(i) for i in range(len(self._centroids))]
+
+    def assign(self, embeddings: np.ndarray, durations: list[float]) -> list[str]:
+        """Meeting-wide labels for one chunk's speakers (rows of embeddings)."""
+        n = len(embeddings)
+        units = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+        assigned: list[int | None] = [None] * n
+        if self._centroids:
+            centroids = np.stack(self._centroids)
+            similarity = units @ (centroids / np.linalg.norm(centroids, axis=1, keepdims=True)).T
+            taken: set[int] = set()
+            for flat in np.argsort(similarity, axis=None)[::-1]:
+                local, speaker = divmod(int(flat), similarity.shape[1])
+                if similarity[local, speaker] < self.threshold:
+                    break
+                if assigned[local] is None and speaker not in taken:
+                    assigned[local] = speaker
+                    taken.add(speaker)
+            for local in range(n):
+                if assigned[local] is None and durations[local] < MIN_NEW_SPEAKER_SECONDS:
+                    assigned[local] = -1 - int(np.argmax(similarity[local]))  # Don't update
+
+        for local in range(n):
+            speaker = assigned[local]
+            if speaker is None:
+                self._centroids.append(units[local] * durations[local])
+                self._weights.append(durations[local])
+                assigned[local] = len(self._centroids) - 1
+            elif speaker >= 0:
+                self._centroids[speaker] = self._centroids[speaker] + units[local] * durations[local]
+                self._weights[speaker] += durations[local]
+            else:
+                assigned[local] = -1 - speaker
+        return [_speaker_label(i) for i in assigned]
+
+
+class IncrementalDiarizer:
+    """Diarizes a meeting chunk by chunk while it is being recorded.
+
+    Each chunk is diarized on its own (pyannote's cost grows faster than
+    linearly with length, so short chunks are cheaper in total) and its
+    speakers' embeddings are clustered with SpeakerClusters, which gives
+    labels that stay stable across the whole meeting. The speaker timeline is
+    kept in meeting time; when the meeting ends, merge() only has to assign
+    speakers to the transcript.
+    """
+
+    def __init__(self, diarizer: SpeakerDiarizer, threshold: float = CLUSTER_THRESHOLD):
+        self.diarizer = diarizer
+        self.clusters = SpeakerClusters(threshold)
+        self.failed: list[ChunkInfo] = []
+        self._timeline: list[tuple[float, float, str]] = []
+        self._done: set[tuple[Path, int]] = set()
+        self._lock = threading.Lock()
+
+    def add_chunk(self, chunk: ChunkInfo) -> None:
+        """Diarize one finished chunk and add its turns to the meeting timeline."""
+        self.diarizer._load_pipeline()
+        waveform = _load_waveform([chunk])
+        diarization, embeddings = self.diarizer._pipeline(
+            _pipeline_input(waveform), return_embeddings=True
+        )
+        del waveform
+
+        local_timeline = _build_speaker_timeline(diarization)
+        local_labels = list(diarization.labels())
+        durations = {label: 0.0 for label in local_labels}
+        for start, end, label in local_timeline:
+            durations[label] += end - start
+        # Speakers with too little speech get NaN embeddings — drop their turns
+        usable = [
+            i for i, label in enumerate(local_labels)
+            if i < len(embeddings) and np.all(np.isfinite(embeddings[i])) and durations[label] > 0
+        ]
+        mapping = {}
+        if usable:
+            labels = self.clusters.assign(
+                np.asarray(embeddings)[usable], [durations[local_labels[i]] for i in usable]
+            )
+            mapping = {local_labels[i]: label for i, label in zip(usable, labels)}
+
+        turns = [
+            (chunk.session_time(start), chunk.session_time(end), mapping[label])
+            for start, end, label in local_timeline
+            if label in mapping
+        ]
+        with self._lock:
+            self._timeline.extend(turns)
+            self._done.add((chunk.path, chunk.offset_samples))
+
+    def complete(self, chunks: list[ChunkInfo]) -> bool:
+        """True if every chunk has been diarized."""
+        with self._lock:
+            return all((c.path, c.offset_samples) in self._done for c in chunks)
+
+    def merge(self, segments: list[TranscriptSegment]) -> list[SpeakerSegment]:
+        """Assign meeting speakers to transcript segments."""
+        with self._lock:
+            timeline = list(self._timeline)
+        return _merge_speakers(segments, timeline)
+
+
+class DiarizationProcess:
+    """Full-meeting diarization in a worker process, alongside transcription.
+
+    The worker loads the pyannote pipeline once and limits torch to `threads`
+    CPU threads, so it shares the machine with transcription instead of
+    competing for every core. submit() returns a Future of the meeting's
+    speaker timeline and the worker's (wall, cpu, peak RSS) for the
+    diarization stage; the caller merges the timeline into the transcript
+    once both are done.
+    """
+
+    def __init__(self, hf_token: str | None, threads: int):
+        if not DIARIZATION_AVAILABLE:
+            raise RuntimeError(
+                "Speaker diarization requires pyannote-audio. "
+                "Install with: uv pip install bizbrain-meetings[diarization]"
+            )
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.threads = threads
+        self._executor = ProcessPoolExecutor(
+            max_workers=1,
+            initializer=_init_diarize_worker,
+            initargs=(hf_token, threads),
+        )
+
+    def submit(self, chunks: list[ChunkInfo]):
+        """Start diarizing a meeting; returns a Future of (timeline, stage timing)."""
+        return self._executor.submit(_diarize_in_worker, chunks)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+# Per-process diarizer for DiarizationProcess
+_worker_diarizer: SpeakerDiarizer | None = None
+
+
+def _init_diarize_worker(hf_token: str | None, threads: int) -> None:
+    global _worker_diarizer
+    import torch
+
+    torch.set_num_threads(threads)
+    _worker_diarizer = SpeakerDiarizer(hf_token=hf_token)
+    _worker_diarizer._load_pipeline()
+
+
+def _diarize_in_worker(
+    chunks: list[ChunkInfo],
+) -> tuple[list[tuple[float, float, str]], tuple[float, float, float]]:
+    timer = StageTimer().start()
+    timeline = _worker_diarizer.diarize_timeline(chunks)
+    return timeline, timer.stop()
+
+
+def _speaker_label(index: int) -> str:
+    return f"SPEAKER_{index:02d}"
+
+
+def _load_waveform(chunks: list[ChunkInfo]) -> np.ndarray:
+    """The recorded audio of all chunks as one float32 [-1, 1] array.
+
+    The array is allocated once and each chunk's int16 samples are scaled into
+    it from their memory-mapped view, so no intermediate copies are made.
+    Chunks that aren't 16kHz mono PCM are decoded by faster-whisper.
+    """
+    waveform = np.empty(sum(c.num_samples for c in chunks), dtype=np.float32)
+    pos = 0
+    for chunk in chunks:
+        try:
+            samples = read_chunk(chunk)
+        except ValueError:
+            from faster_whisper import decode_audio
+
+            samples = decode_audio(str(chunk.path), sampling_rate=SAMPLE_RATE)
+        n = min(len(samples), chunk.num_samples)
+        dest = waveform[pos:pos + n]
+        if samples.dtype == np.int16:
+            np.multiply(samples[:n], np.float32(1 / 32768), out=dest, casting="unsafe")
+        else:
+            dest[:] = samples[:n]
+        pos += n
+    return waveform[:pos]
+
+
+def _pipeline_input(waveform: np.ndarray) -> dict:
+    """pyannote's in-memory audio input: a (channel, time) tensor and its sample rate."""
+    import torch
+
+    return {"waveform": torch.from_numpy(waveform).unsqueeze(0), "sample_rate": SAMPLE_RATE}
+
+
 def _build_speaker_timeline(diarization) -> list[tuple[float, float, str]]:
     """Extract speaker timeline from pyannote diarization result."""
     timeline: list[tuple[float, float, str]] = []
@@ -135,16 +353,27 @@ def _build_speaker_timeline(diarization) -> list[tuple[float, float, str]]:
     return timeline
 
 
+def _to_session_timeline(
+    timeline: list[tuple[float, float, str]],
+    manifest: SessionManifest,
+) -> list[tuple[float, float, str]]:
+    """Map a timeline over the stitched recording back to meeting time."""
+    if not any(c.time_map for c in manifest.chunks):
+        return timeline
+    return [
+        (manifest.session_time(start), manifest.session_time(end), speaker)
+        for start, end, speaker in timeline
+    ]
+
+
 def _merge_speakers(
     segments: list[TranscriptSegment],
     speaker_timeline: list[tuple[float, float, str]],
 ) -> list[SpeakerSegment]:
     """Assign each transcript segment to its dominant speaker."""
+    speakers = _dominant_speakers([(s.start, s.end) for s in segments], speaker_timeline)
     result = []
-    for seg in segments:
-        speaker = SpeakerDiarizer._find_dominant_speaker(
-            seg.start, seg.end, speaker_timeline
-        )
+    for seg, speaker in zip(segments, speakers):
         result.append(SpeakerSegment(
             start=seg.start,
             end=seg.end,
@@ -155,8 +384,46 @@ def _merge_speakers(
     return result
 
 
+def _dominant_speakers(
+    spans: list[tuple[float, float]],
+    timeline: list[tuple[float, float, str]],
+) -> list[str]:
+    """_find_dominant_speaker for many spans at once, in one sweep over the timeline.
+
+    Spans are visited by start time while turns enter an active heap once they
+    start before the span ends and leave it once they end before a span starts,
+    so each span only looks at turns near it: O((n + m) log m) plus the
+    overlaps themselves, instead of O(n × m). Overlaps are summed in timeline
+    order, so totals and ties come out exactly as in _find_dominant_speaker.
+    """
+    turns = sorted(range(len(timeline)), key=lambda i: timeline[i][0])
+    active: list[tuple[float, int]] = []  # (end, timeline index) heap
+    next_turn = 0
+    result = ["Unknown"] * len(spans)
+    for k in sorted(range(len(spans)), key=lambda k: spans[k][0]):
+        start, end = spans[k]
+        while next_turn < len(turns) and timeline[turns[next_turn]][0] < end:
+            i = turns[next_turn]
+            heapq.heappush(active, (timeline[i][1], i))
+            next_turn += 1
+        # Spans come in start order, so a turn ending here is done for good
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+
+        overlap: dict[str, float] = {}
+        for i in sorted(i for _, i in active):
+            t_start, t_end, speaker = timeline[i]
+            o_start = max(start, t_start)
+            o_end = min(end, t_end)
+            if o_start < o_end:
+                overlap[speaker] = overlap.get(speaker, 0) + (o_end - o_start)
+        if overlap:
+            result[k] = max(overlap, key=overlap.get)
+    return result
+
+
 def _stitch_wav_files(chunk_paths: list[Path], output_path: Path) -> None:
-    """Concatenate multiple WAV files into a single file.
+    """Concatenate multiple WAV files into a single file (legacy session recordings).
 
     All chunks must have the same sample rate, channels, and sample width.
     """
@@ -173,4 +440,5 @@ def _stitch_wav_files(chunk_paths: list[Path], output_path: Path) -> None:
             if not chunk_path.exists():
                 continue
             with wave.open(str(chunk_path), "rb") as chunk:
-                out.writeframes(chunk.readframes(chunk.getnframes()))
+                while frames := chunk.readframes(STITCH_BLOCK_FRAMES):
+                    out.writeframes(frames)
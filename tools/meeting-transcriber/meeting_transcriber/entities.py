@@ -0,0 +1,251 @@
+"""Entity keyword matching — every entity name and alias found in one pass over a transcript.
+
+ENTITY-INDEX.md is parsed by load_entity_index(), which caches the compiled
+index in memory and under .bizbrain/, keyed on the file's mtime and size.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Iterator
+
+CACHE_VERSION = 1  # Bump when the parse rules or the cached fields change
+CACHE_FILENAME = "entity-index-cache.json"
+MIN_ALIAS_LENGTH = 3  # Shorter aliases match too much ordinary speech
+HEADER_NAMES = ("entity", "name", "entity name")
+TYPE_FOLDERS = {
+    "client": "Clients",
+    "partner": "Partners",
+    "vendor": "Vendors",
+    "project": "Projects",
+}
+
+
+class EntityIndex:
+    """Compiled matcher over entity names and aliases.
+
+    entities maps each lowercase keyword (a name or alias) to its entity's
+    info: {"name": str, "type": str, "folder": str}.
+
+    All keywords go into a single regex built from a character trie, so the
+    text is scanned once and each position only follows the trie branches its
+    characters allow — no per-keyword search. Matches follow the same rules as
+    re.search(r"\\b" + re.escape(keyword) + r"\\b", text) run for each keyword.
+
+    At each position the regex finds the longest keyword ending on a word
+    boundary. Any shorter keyword that matches there is a prefix of it, and
+    whether it ends on a word boundary depends only on the longer keyword's own
+    characters. So those prefixes are worked out once, when the index is built.
+    """
+
+    def __init__(
+        self,
+        entities: dict[str, dict],
+        _compiled: tuple[str, dict[str, list[str]]] | None = None,
+    ):
+        self.entities = entities
+        self.keywords = list(entities)
+        self._order = {keyword: i for i, keyword in enumerate(self.keywords)}
+        # (pattern source, prefix table) — passed in when loaded from the disk cache
+        source, self._prefixes = _compiled or (
+            r"\b(?=(" + _trie_pattern(self.keywords) + r")\b)" if self.keywords else "",
+            _boundary_prefixes(self.keywords),
+        )
+        self._source = source
+        self._pattern = re.compile(source) if source else None
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def matches(self, text: str) -> Iterator[tuple[int, str]]:
+        """(position, keyword) for every whole-word occurrence of a keyword in text."""
+        if self._pattern is None:
+            return
+        for match in self._pattern.finditer(text):
+            keyword = match.group(1)
+            yield match.start(), keyword
+            for prefix in self._prefixes.get(keyword, ()):
+                yield match.start(), prefix
+
+    def find(self, text: str) -> list[str]:
+        """Keywords that occur in text as whole words, in index order."""
+        found = {keyword for _, keyword in self.matches(text)}
+        return sorted(found, key=self._order.__getitem__)
+
+    def find_mentions(self, texts: list[str]) -> dict[str, list[int]]:
+        """Entity name → indices of the texts (e.g. transcript segments) that mention it.
+
+        The texts are lowercased and scanned as one string, joined with
+        spaces, so the entities found are the same as find_entities() on the
+        joined text. A mention that spans two texts counts for the first.
+        """
+        lowered = [text.lower() for text in texts]
+        starts = []
+        offset = 0
+        for text in lowered:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        mentions: dict[str, set[int]] = {}
+        for position, keyword in self.matches(" ".join(lowered)):
+            name = self.entities[keyword]["name"]
+            mentions.setdefault(name, set()).add(bisect.bisect_right(starts, position) - 1)
+        return {name: sorted(indices) for name, indices in sorted(mentions.items())}
+
+    def find_entities(self, text: str) -> list[dict]:
+        """Info of each entity mentioned in text, one per entity name."""
+        found: dict[str, dict] = {}
+        for keyword in self.find(text):
+            info = self.entities[keyword]
+            found[info["name"]] = info
+        return list(found.values())
+
+    def to_dict(self) -> dict:
+        return {"entities": self.entities, "pattern": self._source, "prefixes": self._prefixes}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> EntityIndex:
+        return cls(d["entities"], _compiled=(d["pattern"], d["prefixes"]))
+
+
+def parse_entity_index(content: str) -> dict[str, dict]:
+    """Parse ENTITY-INDEX.md table rows into keyword → entity info.
+
+    Columns are | Name | Type | Aliases | …; aliases are comma-separated and
+    must be at least MIN_ALIAS_LENGTH characters. Header and separator rows
+    are skipped.
+    """
+    entities: dict[str, dict] = {}
+    for line in content.splitlines():
+        if not line.startswith("|") or "---" in line:
+            continue
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) < 4:
+            continue
+
+        name = parts[1]
+        entity_type = parts[2].lower()
+        if not name or name.lower() in HEADER_NAMES:
+            continue
+
+        info = {"name": name, "type": entity_type, "folder": TYPE_FOLDERS.get(entity_type, "")}
+        entities[name.lower()] = info
+        for alias in parts[3].split(","):
+            alias = alias.strip()
+            if len(alias) >= MIN_ALIAS_LENGTH:
+                entities[alias.lower()] = info
+    return entities
+
+
+# ENTITY-INDEX.md path → ((mtime_ns, size), index), shared by every consumer in the process
+_loaded: dict[Path, tuple[tuple[int, int], EntityIndex]] = {}
+_loaded_lock = threading.Lock()
+
+
+def entity_index_path(brain_path: Path) -> Path:
+    return brain_path / "Operations" / "entity-watchdog" / "ENTITY-INDEX.md"
+
+
+def load_entity_index(brain_path: Path) -> EntityIndex:
+    """The brain's compiled entity index (empty if ENTITY-INDEX.md is missing or unreadable).
+
+    Cached in memory and in .bizbrain/entity-index-cache.json; both are
+    reused until the file's mtime or size changes, so repeat runs skip
+    parsing and trie building.
+    """
+    path = entity_index_path(brain_path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return EntityIndex({})
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    with _loaded_lock:
+        cached = _loaded.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        cache_path = brain_path / ".bizbrain" / CACHE_FILENAME
+        index = _read_cache(cache_path, key)
+        if index is None:
+            try:
+                content = path.read_text(encoding="utf-8")
+            except Exception:
+                return EntityIndex({})
+            index = EntityIndex(parse_entity_index(content))
+            _write_cache(cache_path, key, index)
+        _loaded[path] = (key, index)
+        return index
+
+
+def _read_cache(cache_path: Path, key: tuple[int, int]) -> EntityIndex | None:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+        if data.get("version") != CACHE_VERSION or tuple(data.get("source", ())) != key:
+            return None
+        return EntityIndex.from_dict(data)
+    except Exception:
+        return None  # Missing, corrupt, or from an older version — rebuild
+
+
+def _write_cache(cache_path: Path, key: tuple[int, int], index: EntityIndex) -> None:
+    data = {"version": CACHE_VERSION, "source": list(key), **index.to_dict()}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a concurrent reader never sees a partial file
+        tmp = cache_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        tmp.replace(cache_path)
+    except OSError as e:
+        print(f"Could not cache entity index: {e}")
+
+
+def _trie_pattern(keywords: list[str]) -> str:
+    """Regex alternation over keywords, factored into a trie, longest match first."""
+    end = object()  # Marks a node where a keyword ends
+    root: dict = {}
+    for keyword in keywords:
+        node = root
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[end] = True
+
+    def render(node: dict) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(
+            ((c, n) for c, n in node.items() if c is not end), key=lambda item: item[0]
+        )]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if end in node:
+            # Greedy optional: try the longer keywords first, then stop here
+            return "(?:" + body + ")?"
+        return body
+
+    return render(root)
+
+
+def _boundary_prefixes(keywords: list[str]) -> dict[str, list[str]]:
+    """For each keyword, the shorter keywords that match wherever it matches."""
+    keyword_set = set(keywords)
+    prefixes: dict[str, list[str]] = {}
+    for keyword in keywords:
+        hits = [
+            keyword[:i] for i in range(1, len(keyword))
+            if keyword[:i] in keyword_set and _is_boundary(keyword[i - 1], keyword[i])
+        ]
+        if hits:
+            prefixes[keyword] = hits
+    return prefixes
+
+
+def _is_boundary(before: str, after: str) -> bool:
+    return _is_word(before) != _is_word(after)
+
+
+def _is_word(char: str) -> bool:
+    return char.isalnum() or char == "_"
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import json
-import re
 from datetime import datetime
 from pathlib import Path
 
+from .entities import load_entity_index
 from .models import MeetingInfo, TranscriptSegment, SpeakerSegment
 
 
@@ -41,6 +41,9 @@ def format_transcript_markdown(
         lines.append(f"**Ended:** {meeting.ended_at.strftime('%H:%M')}")
         lines.append(f"**Duration:** {meeting.duration_minutes:.0f} minutes")
 
+    if meeting.language:
+        lines.append(f"**Language:** {meeting.language}")
+
     # Include recording reference if available
     if meeting.recording_path:
         rel_path = meeting.recording_path
@@ -96,6 +99,7 @@ def format_metadata_json(
             "started_at": meeting.started_at.isoformat(),
             "ended_at": meeting.ended_at.isoformat() if meeting.ended_at else None,
             "duration_minutes": round(meeting.duration_minutes, 1),
+            "language": meeting.language,
         },
         "transcript": {
             "segments": len(segments),
@@ -119,12 +123,14 @@ def format_intake_summary(
     meeting: MeetingInfo,
     segments: list[TranscriptSegment | SpeakerSegment],
     brain_path: Path | None = None,
+    detected_entities: list[str] | None = None,
 ) -> str:
     """Generate an enriched intake summary for the brain's intake system.
 
     Dropped into _intake-dump/files/ for entity linking, action item extraction,
     and AI summarization. Includes the full transcript text so Claude can generate
-    a proper summary without needing to read additional files.
+    a proper summary without needing to read additional files. Pass
+    detected_entities when they are already known to skip detection.
     """
     word_count = sum(len(seg.text.split()) for seg in segments)
     full_text = "\n".join(
@@ -132,8 +138,8 @@ def format_intake_summary(
     )
 
     # Detect entities if brain path available
-    detected = []
-    if brain_path:
+    detected = detected_entities or []
+    if detected_entities is None and brain_path:
         detected = _detect_entities_in_transcript(
             segments, brain_path
         )
@@ -143,7 +149,8 @@ def format_intake_summary(
 
     recording_ref = ""
     if meeting.recording_path:
-        recording_ref = f"\n**Recording:** Operations/meetings/recordings/{date_str}-{meeting.slug}.wav"
+        # Use the actual file name — it may carry a -HHMMSS suffix to avoid a clash
+        recording_ref = f"\n**Recording:** Operations/meetings/recordings/{meeting.recording_path.name}"
 
     entities_line = ""
     if detected:
@@ -205,50 +212,35 @@ def _detect_entities_in_transcript(
 
     Returns a list of entity names that appear in the transcript.
     """
-    entity_index = brain_path / "Operations" / "entity-watchdog" / "ENTITY-INDEX.md"
-    if not entity_index.exists():
-        return []
-
-    # Parse entity names and aliases from the index
-    try:
-        content = entity_index.read_text(encoding="utf-8")
-    except Exception:
-        return []
-
-    # Build keyword set from entity names
-    # The ENTITY-INDEX.md typically has lines like:
-    # | Entity Name | Type | Aliases | ...
-    keywords: dict[str, str] = {}  # lowercase keyword → entity name
-    for line in content.splitlines():
-        if not line.startswith("|") or "---" in line or "Entity" in line:
-            continue
-        parts = [p.strip() for p in line.split("|")]
-        if len(parts) >= 3:
-            entity_name = parts[1]
-            if entity_name:
-                # Add the entity name itself
-                keywords[entity_name.lower()] = entity_name
-                # Add aliases if present (typically in column 3 or 4)
-                for part in parts[2:]:
-                    for alias in part.split(","):
-                        alias = alias.strip()
-                        if alias and len(alias) > 2:
-                            keywords[alias.lower()] = entity_name
-
-    if not keywords:
-        return []
-
-    # Combine all transcript text
-    all_text = " ".join(seg.text for seg in segments).lower()
-
-    # Find matches
-    found = set()
-    for keyword, entity_name in keywords.items():
-        # Use word boundary matching to avoid partial matches
-        if re.search(r"\b" + re.escape(keyword) + r"\b", all_text):
-            found.add(entity_name)
-
-    return sorted(found)
+    return sorted(_detect_entity_mentions(segments, brain_path))
+
+
+def _detect_entity_mentions(
+    segments: list[TranscriptSegment | SpeakerSegment],
+    brain_path: Path,
+) -> dict[str, list[int]]:
+    """Entity name → indices of the segments that mention it, in one pass."""
+    index = load_entity_index(brain_path)
+    if not index:
+        return {}
+    return index.find_mentions([seg.text for seg in segments])
+
+
+def format_mentions_json(
+    segments: list[TranscriptSegment | SpeakerSegment],
+    mentions: dict[str, list[int]],
+) -> dict:
+    """Compact per-entity mention index: [segment index, start, end] per mentioning segment."""
+    return {
+        "version": 1,
+        "entities": {
+            name: [
+                [i, round(segments[i].start, 2), round(segments[i].end, 2)]
+                for i in indices
+            ]
+            for name, indices in mentions.items()
+        },
+    }
 
 
 def save_transcript(
@@ -256,15 +248,16 @@ def save_transcript(
     meeting: MeetingInfo,
     segments: list[TranscriptSegment | SpeakerSegment],
 ) -> Path:
-    """Save transcript markdown, JSON metadata, and intake summary to brain.
+    """Save transcript markdown, JSON metadata, entity mentions, and intake summary to brain.
 
     Returns the path to the saved transcript markdown file.
     """
     date_str = meeting.started_at.strftime("%Y-%m-%d")
     filename = f"{date_str}-{meeting.slug}"
 
-    # Detect entities for metadata
-    detected_entities = _detect_entities_in_transcript(segments, brain_path)
+    # Detect entities (and which segments mention them) for metadata
+    mentions = _detect_entity_mentions(segments, brain_path)
+    detected_entities = sorted(mentions)
 
     # Transcript directory
     transcript_dir = brain_path / "Operations" / "meetings" / "transcripts"
@@ -279,12 +272,21 @@ def save_transcript(
     meta = format_metadata_json(meeting, segments, detected_entities=detected_entities)
     meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
 
+    # Save entity mention sidecar — lets the skill and dashboard jump to mentions
+    mentions_path = transcript_dir / f"{filename}.mentions.json"
+    mentions_path.write_text(
+        json.dumps(format_mentions_json(segments, mentions), separators=(",", ":")),
+        encoding="utf-8",
+    )
+
     # Save enriched intake summary for entity linking and AI summarization
     intake_dir = brain_path / "_intake-dump" / "files"
     intake_dir.mkdir(parents=True, exist_ok=True)
     intake_path = intake_dir / f"meeting-{filename}.md"
     intake_path.write_text(
-        format_intake_summary(meeting, segments, brain_path=brain_path),
+        format_intake_summary(
+            meeting, segments, brain_path=brain_path, detected_entities=detected_entities
+        ),
         encoding="utf-8",
     )
 
@@ -0,0 +1,134 @@
+"""Durable post-processing queue — finished meetings are processed off the main loop."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Callable
+
+from .models import MeetingJob
+
+MAX_ATTEMPTS = 3  # A job that fails this many times is left on disk as "failed"
+IDLE_POLL_SEC = 5.0
+
+
+class JobQueue:
+    """On-disk queue of MeetingJob files, one JSON file per meeting.
+
+    Jobs are written before any post-processing starts and removed only once
+    it completes, so a daemon crash or restart never loses a recorded meeting.
+    Files sort by session timestamp, so jobs run in the order meetings ended.
+    """
+
+    def __init__(self, queue_dir: Path):
+        self.queue_dir = queue_dir
+
+    def put(self, job: MeetingJob) -> None:
+        job.save(self._path(job))
+
+    def update(self, job: MeetingJob) -> None:
+        job.save(self._path(job))
+
+    def complete(self, job: MeetingJob) -> None:
+        self._path(job).unlink(missing_ok=True)
+
+    def pending(self) -> list[MeetingJob]:
+        """All unfinished jobs, oldest first (failed jobs excluded)."""
+        if not self.queue_dir.exists():
+            return []
+        jobs = (MeetingJob.load(p) for p in sorted(self.queue_dir.glob("*.json")))
+        return [j for j in jobs if j is not None and j.stage != "failed"]
+
+    def _path(self, job: MeetingJob) -> Path:
+        return self.queue_dir / f"{job.id}.json"
+
+
+class JobWorker:
+    """Background thread that drains a JobQueue through a handler.
+
+    The handler does the actual post-processing for one job. It receives
+    whatever in-memory context was passed to submit() — e.g. the meeting's live
+    transcription worker — or None for jobs resumed from disk after a restart.
+    A handler exception counts as a failed attempt; the job is retried on the
+    next daemon start until MAX_ATTEMPTS is reached.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handler: Callable[[MeetingJob, object | None], None],
+        on_change: Callable[[], None] | None = None,
+    ):
+        self.queue = queue
+        self.handler = handler
+        self.on_change = on_change
+        self._context: dict[str, object] = {}
+        self._skipped: set[str] = set()  # Failed during this run — retried on restart
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._drain = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the worker thread; jobs left over from a previous run go first."""
+        if self._thread is not None:
+            return
+        leftover = len(self.queue.pending())
+        if leftover:
+            print(f"Resuming {leftover} unfinished meeting job(s)")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, job: MeetingJob, context: object | None = None) -> None:
+        """Persist a job and wake the worker."""
+        self.queue.put(job)
+        if context is not None:
+            self._context[job.id] = context
+        self._wake.set()
+
+    def stop(self, drain: bool = True) -> None:
+        """Stop the worker. With drain, wait until every queued job has run."""
+        self._drain = drain
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _next(self) -> MeetingJob | None:
+        for job in self.queue.pending():
+            if job.id not in self._skipped:
+                return job
+        return None
+
+    def _run(self) -> None:
+        while True:
+            job = self._next()
+            if job is None or (self._stop.is_set() and not self._drain):
+                if self._stop.is_set():
+                    return
+                self._wake.wait(IDLE_POLL_SEC)
+                self._wake.clear()
+                continue
+            self._process(job)
+
+    def _process(self, job: MeetingJob) -> None:
+        context = self._context.pop(job.id, None)
+        try:
+            self.handler(job, context)
+        except Exception as e:
+            job.attempts += 1
+            job.error = str(e)
+            if job.attempts >= MAX_ATTEMPTS:
+                job.stage = "failed"
+            print(f"Post-processing failed for {job.id} (attempt {job.attempts}): {e}")
+            self._skipped.add(job.id)
+            self.queue.update(job)
+        else:
+            self.queue.complete(job)
+        if self.on_change:
+            try:
+                self.on_change()
+            except Exception as e:
+                print(f"Status update failed: {e}")
@@ -0,0 +1,74 @@
+"""Per-meeting language lock — detect the spoken language once, then reuse it."""
+
+from __future__ import annotations
+
+import threading
+
+from .models import TranscriptSegment
+
+MIN_SPEECH_SECONDS = 20.0  # Transcribed speech a chunk needs before its detection is trusted
+MIN_DETECT_PROBABILITY = 0.7  # faster-whisper language_probability needed to lock
+CONFIDENCE_DROP = 0.5  # Fall in mean avg_logprob (vs. the locked baseline) that triggers re-detection
+BASELINE_WEIGHT = 0.3
+
+
+class LanguageLock:
+    """The language of one meeting, shared by every chunk transcribed for it.
+
+    Until a language is locked, chunks are transcribed with detection and the
+    first one with enough speech and a confident detection locks it. Locked
+    chunks skip detection; their mean avg_logprob is tracked, and a chunk that
+    scores far below the meeting's baseline (e.g. the conversation switched
+    language) is offered for re-detection. A language given up front (e.g. a
+    resumed meeting's) starts locked but can still be re-detected.
+    """
+
+    def __init__(self, language: str | None = None):
+        self.language = language
+        self.probability: float | None = None
+        self._baseline: float | None = None
+        self._lock = threading.Lock()
+
+    def offer(self, segments: list[TranscriptSegment], probability: float | None) -> bool:
+        """Consider a chunk transcribed with detection. Returns True if the lock changed.
+
+        probability is faster-whisper's language_probability (None when the
+        result came from the transcript cache).
+        """
+        if not segments:
+            return False
+        speech = sum(s.end - s.start for s in segments)
+        if speech < MIN_SPEECH_SECONDS:
+            return False
+        if probability is not None and probability < MIN_DETECT_PROBABILITY:
+            return False
+        language = segments[0].language
+        with self._lock:
+            if language == self.language:
+                return False
+            previous, self.language, self.probability = self.language, language, probability
+            self._baseline = _mean_logprob(segments)
+        confidence = f" ({probability:.0%})" if probability is not None else ""
+        if previous is None:
+            print(f"Language detected: {language}{confidence} — locked for this meeting")
+        else:
+            print(f"Language switched: {previous} → {language}{confidence}")
+        return True
+
+    def confidence_dropped(self, segments: list[TranscriptSegment]) -> bool:
+        """Track a chunk transcribed with the locked language; True if it should be re-detected."""
+        if not segments:
+            return False
+        score = _mean_logprob(segments)
+        with self._lock:
+            if self._baseline is None:
+                self._baseline = score
+                return False
+            if score < self._baseline - CONFIDENCE_DROP:
+                return True
+            self._baseline = BASELINE_WEIGHT * score + (1 - BASELINE_WEIGHT) * self._baseline
+            return False
+
+
+def _mean_logprob(segments: list[TranscriptSegment]) -> float:
+    return sum(s.probability for s in segments) / len(segments)
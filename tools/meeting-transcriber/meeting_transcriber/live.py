@@ -0,0 +1,158 @@
+"""Live transcription — transcribes audio chunks while the meeting is still running."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Callable
+
+from .metrics import MeetingMetrics
+from .models import ChunkInfo, TranscriptSegment
+from .transcriber import WhisperTranscriber
+
+if TYPE_CHECKING:
+    from .adaptive import AdaptivePolicy
+    from .diarizer import IncrementalDiarizer
+    from .language import LanguageLock
+
+
+class LiveTranscriptionWorker:
+    """Background worker that transcribes each chunk as soon as it is finalized.
+
+    The recorder hands finished chunks to submit(); a single worker thread
+    transcribes them in order, placing each at its manifest offset, so the
+    full transcript is ready moments after the meeting ends. If chunks pile up
+    (a slow model, or the last few at meeting end) and workers > 1, the backlog
+    is transcribed in parallel worker processes. With an AdaptivePolicy, the
+    model and beam size are re-chosen before every batch. Without a language,
+    a LanguageLock detects it on the first chunk with enough speech and reuses
+    it for the rest of the meeting. With an IncrementalDiarizer, each chunk is
+    also diarized once it has been transcribed.
+    """
+
+    def __init__(
+        self,
+        transcriber: WhisperTranscriber,
+        language: str | None = None,
+        on_progress: Callable[[int], None] | None = None,
+        workers: int = 1,
+        metrics: MeetingMetrics | None = None,
+        policy: AdaptivePolicy | None = None,
+        lock: LanguageLock | None = None,
+        diarizer: IncrementalDiarizer | None = None,
+    ):
+        self.transcriber = transcriber
+        self.language = language
+        self.workers = workers
+        self.on_progress = on_progress
+        self.metrics = metrics or MeetingMetrics()  # Time spent transcribing
+        self.policy = policy
+        self.lock = lock
+        self.diarizer = diarizer
+        self.failed: list[ChunkInfo] = []
+        self._queue: queue.Queue[ChunkInfo | None] = queue.Queue()
+        self._segments: list[TranscriptSegment] = []
+        self._chunks_transcribed = 0
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def chunks_transcribed(self) -> int:
+        with self._lock:
+            return self._chunks_transcribed
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, chunk: ChunkInfo) -> None:
+        """Queue a finalized chunk for transcription."""
+        if self.policy:
+            self.policy.enqueue(chunk.duration_seconds)
+        self._queue.put(chunk)
+
+    def finish(self) -> list[TranscriptSegment]:
+        """Wait for all queued chunks to be transcribed and return the segments."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            return list(self._segments)
+
+    def _run(self) -> None:
+        pending: list[ChunkInfo] = []
+        stopping = False
+        while pending or not stopping:
+            # Block only when idle; otherwise collect whatever else has arrived
+            items = [] if pending else [self._queue.get()]
+            while not self._queue.empty():
+                items.append(self._queue.get_nowait())
+            stopping = stopping or None in items
+            chunks = [c for c in items if c is not None]
+            pending.extend(c for c in chunks if c.path.exists())
+            self._release([c for c in chunks if not c.path.exists()])
+            if not pending:
+                continue
+
+            if self.workers > 1 and len(pending) > 1:
+                batch, pending = pending, []
+            else:
+                batch, pending = pending[:1], pending[1:]
+            self._transcribe(batch)
+            if self.diarizer:
+                self._diarize(batch)
+
+    def _transcribe(self, batch: list[ChunkInfo]) -> None:
+        setting = self.policy.apply(self.transcriber) if self.policy else None
+        started = time.perf_counter()
+        try:
+            with self.metrics.stage("transcription"):
+                if len(batch) > 1:
+                    segments = self.transcriber.transcribe_chunks(
+                        batch, language=self.language, workers=self.workers, lock=self.lock
+                    )
+                else:
+                    segments = self.transcriber.transcribe_chunk(
+                        batch[0], language=self.language, lock=self.lock
+                    )
+        except Exception as e:
+            names = ", ".join(f"{c.path.name} @ {c.offset_samples / c.sample_rate:.0f}s" for c in batch)
+            print(f"Live transcription failed for {names}: {e}")
+            self.failed.extend(batch)
+            self._release(batch)
+            return
+
+        if self.policy:
+            audio = sum(c.duration_seconds for c in batch)
+            self.policy.observe(setting, audio, time.perf_counter() - started)
+
+        with self._lock:
+            self._segments.extend(segments)
+            self._chunks_transcribed += len(batch)
+            done = self._chunks_transcribed
+
+        if self.on_progress:
+            try:
+                self.on_progress(done)
+            except Exception as e:
+                print(f"Status update failed: {e}")
+
+    def _diarize(self, batch: list[ChunkInfo]) -> None:
+        for chunk in batch:
+            try:
+                with self.metrics.stage("diarization"):
+                    self.diarizer.add_chunk(chunk)
+            except Exception as e:
+                where = f"{chunk.path.name} @ {chunk.offset_samples / chunk.sample_rate:.0f}s"
+                print(f"Live diarization failed for {where}: {e}")
+                self.diarizer.failed.append(chunk)
+
+    def _release(self, chunks: list[ChunkInfo]) -> None:
+        """Drop chunks that will not be transcribed from the policy's backlog."""
+        if self.policy and chunks:
+            self.policy.observe(self.policy.setting, sum(c.duration_seconds for c in chunks), None)
@@ -0,0 +1,200 @@
+"""Per-meeting stage metrics — wall time, CPU time, peak RSS and real-time factor."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+STAGES = ("recording", "stitching", "transcription", "diarization", "formatting", "entities")
+SAMPLE_INTERVAL_SEC = 0.5  # RSS sampling period while a stage runs
+STATUS_WINDOW = 50  # Meetings considered by `bizbrain-meetings status`
+
+
+def _process():
+    import psutil
+
+    return psutil.Process(os.getpid())
+
+
+def _cpu_seconds(proc) -> float:
+    """CPU time of this process and its children (worker pools included)."""
+    t = proc.cpu_times()
+    total = t.user + t.system + t.children_user + t.children_system
+    for child in proc.children(recursive=True):
+        try:
+            c = child.cpu_times()
+            total += c.user + c.system
+        except Exception:
+            pass  # Child exited between listing and sampling
+    return total
+
+
+def _rss_mb(proc) -> float:
+    """Resident memory of this process and its children in MB."""
+    rss = proc.memory_info().rss
+    for child in proc.children(recursive=True):
+        try:
+            rss += child.memory_info().rss
+        except Exception:
+            pass
+    return rss / (1024 * 1024)
+
+
+class StageTimer:
+    """Measures one stretch of work: wall time, CPU time, and peak RSS.
+
+    CPU and RSS are process-wide (plus child processes), so stages that
+    overlap in time — recording and live transcription — share them.
+    """
+
+    def __init__(self):
+        self._proc = _process()
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+        self._start_wall = 0.0
+        self._start_cpu = 0.0
+        self.peak_rss_mb = 0.0
+
+    def start(self) -> StageTimer:
+        self._start_wall = time.perf_counter()
+        self._start_cpu = _cpu_seconds(self._proc)
+        self.peak_rss_mb = _rss_mb(self._proc)
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+        self._sampler.start()
+        return self
+
+    def stop(self) -> tuple[float, float, float]:
+        """Stop timing. Returns (wall_seconds, cpu_seconds, peak_rss_mb)."""
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        self.peak_rss_mb = max(self.peak_rss_mb, _rss_mb(self._proc))
+        wall = time.perf_counter() - self._start_wall
+        cpu = _cpu_seconds(self._proc) - self._start_cpu
+        return wall, cpu, self.peak_rss_mb
+
+    def _sample(self) -> None:
+        while not self._stop.wait(SAMPLE_INTERVAL_SEC):
+            try:
+                self.peak_rss_mb = max(self.peak_rss_mb, _rss_mb(self._proc))
+            except Exception:
+                return
+
+
+class MeetingMetrics:
+    """Stage metrics for one meeting.
+
+    A stage measured more than once (e.g. live transcription, chunk by chunk)
+    accumulates wall and CPU time and keeps the highest peak RSS. Real-time
+    factor is stage wall time divided by the meeting's audio duration.
+    """
+
+    def __init__(self, audio_seconds: float = 0.0):
+        self.audio_seconds = audio_seconds
+        self.stages: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, wall: float, cpu: float, peak_rss_mb: float) -> None:
+        with self._lock:
+            stage = self.stages.setdefault(
+                name, {"wall_seconds": 0.0, "cpu_seconds": 0.0, "peak_rss_mb": 0.0}
+            )
+            stage["wall_seconds"] += wall
+            stage["cpu_seconds"] += cpu
+            stage["peak_rss_mb"] = max(stage["peak_rss_mb"], peak_rss_mb)
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as (part of) a stage."""
+        timer = StageTimer().start()
+        try:
+            yield
+        finally:
+            self.add(name, *timer.stop())
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            stages = {}
+            for name in sorted(self.stages, key=_stage_order):
+                s = self.stages[name]
+                stages[name] = {
+                    "wall_seconds": round(s["wall_seconds"], 3),
+                    "cpu_seconds": round(s["cpu_seconds"], 3),
+                    "peak_rss_mb": round(s["peak_rss_mb"], 1),
+                    "real_time_factor": (
+                        round(s["wall_seconds"] / self.audio_seconds, 4)
+                        if self.audio_seconds else None
+                    ),
+                }
+        return {"audio_seconds": round(self.audio_seconds, 2), "stages": stages}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> MeetingMetrics:
+        metrics = cls(audio_seconds=d.get("audio_seconds", 0.0))
+        for name, s in d.get("stages", {}).items():
+            metrics.add(name, s["wall_seconds"], s["cpu_seconds"], s["peak_rss_mb"])
+        return metrics
+
+    def append_record(self, path: Path, meeting_id: str, title: str) -> None:
+        """Append this meeting's metrics as one line of the metrics log."""
+        record = {
+            "meeting": meeting_id,
+            "title": title,
+            "recorded_at": datetime.now().isoformat(),
+            **self.to_dict(),
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def write_to_sidecar(self, meta_path: Path) -> None:
+        """Add the metrics to a transcript's .meta.json sidecar."""
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        meta["metrics"] = self.to_dict()
+        meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+
+def _stage_order(name: str) -> int:
+    return STAGES.index(name) if name in STAGES else len(STAGES)
+
+
+def load_records(path: Path, limit: int = STATUS_WINDOW) -> list[dict]:
+    """The most recent metrics records (oldest first)."""
+    if not path.exists():
+        return []
+    records = []
+    for line in path.read_text(encoding="utf-8").splitlines()[-limit:]:
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return records
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(records: list[dict]) -> dict[str, dict[str, tuple[float, float, float]]]:
+    """Per stage and metric, the (p50, p90, max) across records."""
+    summary = {}
+    for name in STAGES:
+        stages = [r["stages"][name] for r in records if name in r.get("stages", {})]
+        if not stages:
+            continue
+        summary[name] = {}
+        for key in ("wall_seconds", "cpu_seconds", "peak_rss_mb", "real_time_factor"):
+            values = [s[key] for s in stages if s.get(key) is not None]
+            if values:
+                summary[name][key] = (percentile(values, 50), percentile(values, 90), max(values))
+    return summary
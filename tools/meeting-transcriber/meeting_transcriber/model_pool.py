@@ -0,0 +1,114 @@
+"""Resident Whisper model pool — keeps loaded models warm across meetings."""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+
+DEFAULT_IDLE_MINUTES = 30  # Unload a model after this long without use
+
+ModelKey = tuple[str, str, str]  # (model_size, device, compute_type)
+
+
+@dataclass
+class _PooledModel:
+    model: object | None
+    ref: weakref.ref
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class WhisperModelPool:
+    """Daemon-level cache of faster-whisper models keyed on (model_size, device, compute_type).
+
+    Models are loaded once and handed to every WhisperTranscriber that asks for
+    the same key. After idle_minutes without a get(), the pool drops its strong
+    reference so the memory is released once no transcriber still holds the
+    model; a later get() re-promotes the model if it is still alive, so a model
+    is never loaded twice. idle_minutes=None keeps models resident forever.
+    """
+
+    def __init__(self, idle_minutes: float | None = DEFAULT_IDLE_MINUTES):
+        self.idle_minutes = idle_minutes
+        self._models: dict[ModelKey, _PooledModel] = {}
+        self._key_locks: dict[ModelKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._reaper: threading.Thread | None = None
+
+    def get(self, model_size: str, device: str, compute_type: str):
+        """Return the model for this key, loading it on first use."""
+        key = (model_size, device, compute_type)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Per-key lock so a background warm-up and a first transcription never
+        # load the same model twice; other keys can load concurrently.
+        with key_lock:
+            with self._lock:
+                entry = self._models.get(key)
+                if entry is not None:
+                    model = entry.model or entry.ref()
+                    if model is not None:
+                        entry.model = model
+                        entry.last_used = time.monotonic()
+                        return model
+
+            from faster_whisper import WhisperModel
+
+            model = WhisperModel(model_size, device=device, compute_type=compute_type)
+            with self._lock:
+                self._models[key] = _PooledModel(model=model, ref=weakref.ref(model))
+            return model
+
+    def warm_up(self, model_size: str, device: str, compute_type: str) -> threading.Thread:
+        """Load a model in a background thread so the first meeting doesn't wait."""
+
+        def _load():
+            try:
+                self.get(model_size, device, compute_type)
+            except Exception as e:
+                print(f"Model warm-up failed ({model_size}): {e}")
+
+        thread = threading.Thread(target=_load, daemon=True)
+        thread.start()
+        return thread
+
+    def evict_idle(self) -> list[ModelKey]:
+        """Drop models unused for longer than idle_minutes. Returns evicted keys."""
+        if self.idle_minutes is None:
+            return []
+        cutoff = time.monotonic() - self.idle_minutes * 60
+        evicted = []
+        with self._lock:
+            for key, entry in list(self._models.items()):
+                if entry.model is not None and entry.last_used < cutoff:
+                    entry.model = None
+                    evicted.append(key)
+                if entry.model is None and entry.ref() is None:
+                    del self._models[key]
+        return evicted
+
+    def start_reaper(self) -> None:
+        """Start the background thread that unloads idle models."""
+        if self.idle_minutes is None or self._reaper is not None:
+            return
+        self._stop.clear()
+        self._reaper = threading.Thread(target=self._reap_loop, daemon=True)
+        self._reaper.start()
+
+    def stop(self) -> None:
+        """Stop the reaper and release every model."""
+        self._stop.set()
+        if self._reaper:
+            self._reaper.join(timeout=5)
+            self._reaper = None
+        with self._lock:
+            self._models.clear()
+
+    def _reap_loop(self) -> None:
+        interval = min(60.0, max(1.0, self.idle_minutes * 60 / 4))
+        while not self._stop.wait(interval):
+            for model_size, device, compute_type in self.evict_idle():
+                print(f"Unloaded idle Whisper model: {model_size} ({device}, {compute_type})")
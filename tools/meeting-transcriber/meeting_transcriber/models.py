@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import bisect
 import json
+import os
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
@@ -21,6 +23,7 @@ class MeetingInfo:
     audio_chunks: list[Path] = field(default_factory=list)
     transcript_path: Path | None = None
     recording_path: Path | None = None
+    language: str | None = None  # Spoken language, forced or detected once per meeting
 
     @property
     def slug(self) -> str:
@@ -43,6 +46,21 @@ class MeetingInfo:
         d["recording_path"] = str(self.recording_path) if self.recording_path else None
         return d
 
+    @classmethod
+    def from_dict(cls, d: dict) -> MeetingInfo:
+        return cls(
+            platform=d["platform"],
+            title=d["title"],
+            started_at=datetime.fromisoformat(d["started_at"]),
+            ended_at=datetime.fromisoformat(d["ended_at"]) if d.get("ended_at") else None,
+            process_name=d.get("process_name", ""),
+            window_title=d.get("window_title", ""),
+            audio_chunks=[Path(p) for p in d.get("audio_chunks", [])],
+            transcript_path=Path(d["transcript_path"]) if d.get("transcript_path") else None,
+            recording_path=Path(d["recording_path"]) if d.get("recording_path") else None,
+            language=d.get("language"),
+        )
+
 
 @dataclass
 class TranscriptSegment:
@@ -66,6 +84,160 @@ class SpeakerSegment:
     language: str = "en"
 
 
+@dataclass
+class ChunkInfo:
+    """One recorded audio chunk and its exact position in the session."""
+
+    path: Path  # WAV holding the chunk — the session recording, or a standalone chunk file
+    offset_samples: int  # First sample of this chunk in the recorded (stitched) audio
+    num_samples: int
+    sample_rate: int = 16000
+    # (sample within chunk, meeting sample) breakpoints where dropped silence shifts
+    # the timeline. Empty when the chunk maps 1:1 onto the recorded audio.
+    time_map: list[tuple[int, int]] = field(default_factory=list)
+    # First sample of the chunk within path; None when path holds just this chunk
+    file_offset: int | None = None
+
+    @property
+    def offset_seconds(self) -> float:
+        return self.offset_samples / self.sample_rate
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.num_samples / self.sample_rate
+
+    def session_time(self, seconds: float) -> float:
+        """Map a time within this chunk to meeting time, restoring dropped silence."""
+        pos = seconds * self.sample_rate
+        if not self.time_map:
+            return (self.offset_samples + pos) / self.sample_rate
+        i = max(bisect.bisect_right(self.time_map, (pos, float("inf"))) - 1, 0)
+        chunk_pos, meeting_pos = self.time_map[i]
+        return (meeting_pos + pos - chunk_pos) / self.sample_rate
+
+
+@dataclass
+class SessionManifest:
+    """Index of the chunks recorded in one session directory (manifest.json).
+
+    Sessions record into one audio file (audio_path) and chunks are sample
+    ranges of it; older sessions have one WAV file per chunk instead.
+    """
+
+    sample_rate: int = 16000
+    chunks: list[ChunkInfo] = field(default_factory=list)
+    audio_path: Path | None = None
+
+    FILENAME = "manifest.json"
+
+    @property
+    def total_samples(self) -> int:
+        return sum(c.num_samples for c in self.chunks)
+
+    def session_time(self, recorded_seconds: float) -> float:
+        """Map a time in the stitched recording to meeting time."""
+        pos = recorded_seconds * self.sample_rate
+        for chunk in reversed(self.chunks):
+            if chunk.offset_samples <= pos:
+                return chunk.session_time((pos - chunk.offset_samples) / self.sample_rate)
+        return recorded_seconds
+
+    def save(self, path: Path) -> None:
+        data: dict = {"sample_rate": self.sample_rate}
+        if self.audio_path is not None:
+            # Relative, so the brain folder can be moved or synced as a whole
+            data["file"] = os.path.relpath(self.audio_path, path.parent)
+        data["chunks"] = [
+            {
+                **({} if c.path == self.audio_path else {"file": c.path.name}),
+                "offset_samples": c.offset_samples,
+                "num_samples": c.num_samples,
+                **({"file_offset": c.file_offset} if c.file_offset is not None else {}),
+                **({"time_map": c.time_map} if c.time_map else {}),
+            }
+            for c in self.chunks
+        ]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a crash never leaves a truncated manifest
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, indent=2))
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> SessionManifest | None:
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text())
+            sample_rate = data.get("sample_rate", 16000)
+            audio_path = None
+            if data.get("file"):
+                audio_path = Path(os.path.normpath(path.parent / data["file"]))
+            return cls(
+                sample_rate=sample_rate,
+                audio_path=audio_path,
+                chunks=[
+                    ChunkInfo(
+                        path=audio_path if audio_path and "file" not in c else path.parent / c["file"],
+                        offset_samples=c["offset_samples"],
+                        num_samples=c["num_samples"],
+                        sample_rate=sample_rate,
+                        time_map=[tuple(p) for p in c.get("time_map", [])],
+                        file_offset=c.get("file_offset"),
+                    )
+                    for c in data.get("chunks", [])
+                ],
+            )
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return None
+
+
+@dataclass
+class MeetingJob:
+    """A recorded meeting waiting for post-processing (one file in the job queue)."""
+
+    meeting: MeetingInfo
+    session_dir: Path  # Directory holding the meeting's audio chunks and manifest
+    stage: str = "queued"  # queued → saved (transcript written, brain updated) → removed; or failed
+    attempts: int = 0
+    error: str | None = None
+    metrics: dict = field(default_factory=dict)  # Stage metrics gathered so far
+
+    @property
+    def id(self) -> str:
+        return self.session_dir.name
+
+    def save(self, path: Path) -> None:
+        data = {
+            "meeting": self.meeting.to_dict(),
+            "session_dir": str(self.session_dir),
+            "stage": self.stage,
+            "attempts": self.attempts,
+            "error": self.error,
+            "metrics": self.metrics,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a crash never leaves a truncated job
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, indent=2))
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> MeetingJob | None:
+        try:
+            data = json.loads(path.read_text())
+            return cls(
+                meeting=MeetingInfo.from_dict(data["meeting"]),
+                session_dir=Path(data["session_dir"]),
+                stage=data.get("stage", "queued"),
+                attempts=data.get("attempts", 0),
+                error=data.get("error"),
+                metrics=data.get("metrics", {}),
+            )
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return None
+
+
 @dataclass
 class DaemonStatus:
     """Status of the meeting transcription daemon."""
@@ -76,6 +248,7 @@ class DaemonStatus:
     current_meeting: MeetingInfo | None = None
     chunks_recorded: int = 0
     chunks_transcribed: int = 0
+    jobs_pending: int = 0
     started_at: str | None = None
     last_check: str | None = None
 
@@ -86,6 +259,7 @@ class DaemonStatus:
             "meeting_active": self.meeting_active,
             "chunks_recorded": self.chunks_recorded,
             "chunks_transcribed": self.chunks_transcribed,
+            "jobs_pending": self.jobs_pending,
             "started_at": self.started_at,
             "last_check": self.last_check,
         }
@@ -106,6 +280,7 @@ class DaemonStatus:
                 meeting_active=data.get("meeting_active", False),
                 chunks_recorded=data.get("chunks_recorded", 0),
                 chunks_transcribed=data.get("chunks_transcribed", 0),
+                jobs_pending=data.get("jobs_pending", 0),
                 started_at=data.get("started_at"),
                 last_check=data.get("last_check"),
             )
@@ -1,9 +1,16 @@
-"""Platform-dispatching audio recorder — routes to WASAPI (Windows) or BlackHole (macOS)."""
+"""Platform-dispatching audio recorder — routes to WASAPI (Windows) or BlackHole (macOS).
+
+FileReplayRecorder is available everywhere and replays WAV files through the
+same pipeline for benchmarks and tests.
+"""
 
 from __future__ import annotations
 
 import platform
 
+from ._recorder_base import CHUNK_DURATION_SEC
+from ._recorder_replay import FileReplayRecorder
+
 _system = platform.system()
 
 if _system == "Darwin":
@@ -17,7 +24,8 @@ else:
         def __init__(self, *args, **kwargs):
             raise RuntimeError(
                 f"Meeting recording is not supported on {_system}. "
-                "Supported platforms: Windows (WASAPI), macOS (BlackHole)."
+                "Supported platforms: Windows (WASAPI), macOS (BlackHole). "
+                "Use --replay <file.wav> to run the pipeline from recorded audio."
             )
 
-__all__ = ["LoopbackRecorder"]
+__all__ = ["CHUNK_DURATION_SEC", "FileReplayRecorder", "LoopbackRecorder"]
@@ -2,62 +2,151 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from .models import TranscriptSegment
+import numpy as np
+
+from ._audio import SAMPLE_RATE, read_chunk, read_wav_view
+from .models import ChunkInfo, SessionManifest, TranscriptSegment
+from .transcript_cache import TranscriptCache, hash_audio, hash_file
+
+if TYPE_CHECKING:
+    from .language import LanguageLock
+    from .model_pool import WhisperModelPool
 
 
 # Model sizes in order of speed → accuracy
 MODEL_SIZES = ("tiny", "base", "small", "medium", "large-v3")
 DEFAULT_MODEL = "base"
 
+# "sequential" decodes one window at a time; "batched" uses faster-whisper's
+# BatchedInferencePipeline to decode VAD-split windows together
+ENGINES = ("sequential", "batched")
+DEFAULT_BATCH_SIZE = 16
+DEFAULT_BEAM_SIZE = 5
+
+# Two-pass mode: draft segments whose avg_logprob falls below this are
+# re-decoded with the refine model
+DEFAULT_REFINE_THRESHOLD = -0.8
+MIN_REFINE_SAMPLES = SAMPLE_RATE // 100  # One 10ms feature frame; shorter clips keep the draft
+
 
 class WhisperTranscriber:
     """Transcribes WAV audio files using faster-whisper.
 
     Models are downloaded on first use (~75MB for base, ~3GB for large-v3).
-    VAD filtering is enabled by default to skip silence.
+    VAD filtering is enabled by default to skip silence. Pass a WhisperModelPool
+    to share one resident model between transcribers instead of loading per instance,
+    and a TranscriptCache to reuse results for audio that was already transcribed
+    with the same settings. engine="batched" opts into faster-whisper's batched
+    pipeline, which is usually much faster on CPU; output is the same segment list.
+
+    With refine_model set, transcription is two-pass: the whole audio is
+    drafted with model_size, then only runs of segments below refine_threshold
+    (avg_logprob) are re-decoded with the larger refine_model — from slices of
+    the same sample array — and spliced back in where they score better.
     """
 
-    def __init__(self, model_size: str = DEFAULT_MODEL, device: str = "auto"):
-        if model_size not in MODEL_SIZES:
-            raise ValueError(f"Invalid model size: {model_size}. Choose from {MODEL_SIZES}")
+    def __init__(
+        self,
+        model_size: str = DEFAULT_MODEL,
+        device: str = "auto",
+        compute_type: str | None = None,
+        pool: WhisperModelPool | None = None,
+        cache: TranscriptCache | None = None,
+        cpu_threads: int = 0,
+        engine: str = "sequential",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        beam_size: int = DEFAULT_BEAM_SIZE,
+        refine_model: str | None = None,
+        refine_threshold: float = DEFAULT_REFINE_THRESHOLD,
+    ):
+        for size in (model_size, refine_model):
+            if size is not None and size not in MODEL_SIZES:
+                raise ValueError(f"Invalid model size: {size}. Choose from {MODEL_SIZES}")
+        if engine not in ENGINES:
+            raise ValueError(f"Invalid engine: {engine}. Choose from {ENGINES}")
         self.model_size = model_size
         self.device = device
+        self.compute_type = compute_type or ("int8" if device == "cpu" else "auto")
+        self._pool = pool
+        self.cache = cache
+        self.cpu_threads = cpu_threads  # 0 = CTranslate2 default
+        self.cpu_budget: int | None = None  # Cores transcribe_chunks may spread over; None = all
+        self.engine = engine
+        self.batch_size = batch_size
+        self.beam_size = beam_size
+        self.refine_model = refine_model
+        self.refine_threshold = refine_threshold
         self._model = None
+        self._batched = None  # BatchedInferencePipeline wrapping self._model
+        self._refiner: WhisperTranscriber | None = None
+        self._executor = None  # Worker process pool for transcribe_chunks, kept until close()
+        self._executor_key: tuple | None = None  # (workers, worker settings) it was built with
+        # language_probability of the last decode that ran detection (None: cache hit / forced)
+        self.last_language_probability: float | None = None
+
+    def use_model(self, model_size: str) -> None:
+        """Switch to another model size; it is loaded (or fetched from the pool) on next use."""
+        if model_size not in MODEL_SIZES:
+            raise ValueError(f"Invalid model size: {model_size}. Choose from {MODEL_SIZES}")
+        if model_size != self.model_size:
+            self.model_size = model_size
+            self._model = None
 
     def _load_model(self):
+        if self._pool is not None:
+            # Ask the pool on every use so its idle clock stays fresh
+            self._model = self._pool.get(self.model_size, self.device, self.compute_type)
+            return
         if self._model is not None:
             return
         from faster_whisper import WhisperModel
 
-        compute_type = "int8" if self.device == "cpu" else "auto"
         self._model = WhisperModel(
             self.model_size,
             device=self.device,
-            compute_type=compute_type,
+            compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads,
         )
 
-    def transcribe(self, audio_path: Path, language: str | None = None) -> list[TranscriptSegment]:
-        """Transcribe a WAV file and return segments.
+    def transcribe(
+        self,
+        audio: Path | np.ndarray,
+        language: str | None = None,
+    ) -> list[TranscriptSegment]:
+        """Transcribe a WAV file or in-memory samples and return segments.
 
         Args:
-            audio_path: Path to 16kHz mono WAV file.
+            audio: Path to an audio file, or 16kHz mono samples — int16 (e.g. a
+                memory-mapped WAV view) or float32 in [-1, 1]. Arrays skip
+                faster-whisper's file decode entirely.
             language: ISO language code (e.g., "en"). None for auto-detect.
 
         Returns:
             List of TranscriptSegment with timestamps and text.
         """
+        in_memory = isinstance(audio, np.ndarray)
+        self.last_language_probability = None
+        cache_key = None
+        if self.cache is not None:
+            audio_hash = hash_audio(audio) if in_memory else hash_file(audio)
+            cache_key = self.cache.make_key(audio_hash, self._cache_params(language))
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         self._load_model()
 
-        segments, info = self._model.transcribe(
-            str(audio_path),
+        segments, info = self._decoder().transcribe(
+            _to_float32(audio) if in_memory else str(audio),
             language=language,
-            vad_filter=True,
-            vad_parameters={"min_silence_duration_ms": 500},
-            beam_size=5,
-            word_timestamps=False,
+            **self._decode_options(),
         )
+        if language is None:
+            self.last_language_probability = info.language_probability
 
         result = []
         for seg in segments:
@@ -72,44 +161,361 @@ class WhisperTranscriber:
                 probability=seg.avg_logprob,
             ))
 
+        if self.refine_model and any(s.probability < self.refine_threshold for s in result):
+            result = self._refine(result, audio, language or info.language)
+
+        if cache_key is not None:
+            self.cache.put(cache_key, result)
         return result
 
+    def _refine(
+        self,
+        segments: list[TranscriptSegment],
+        audio: Path | np.ndarray,
+        language: str,
+    ) -> list[TranscriptSegment]:
+        """Second pass: re-decode runs of low-confidence segments with the refine model."""
+        if isinstance(audio, np.ndarray):
+            samples = _to_float32(audio)
+        else:
+            try:
+                samples = _to_float32(read_wav_view(audio))
+            except ValueError:
+                from faster_whisper import decode_audio
+
+                samples = decode_audio(str(audio), sampling_rate=SAMPLE_RATE)
+
+        if self._refiner is None:
+            self._refiner = WhisperTranscriber(
+                model_size=self.refine_model,
+                device=self.device,
+                compute_type=self.compute_type,
+                pool=self._pool,
+                cpu_threads=self.cpu_threads,
+                beam_size=self.beam_size,
+            )
+
+        refined: list[TranscriptSegment] = []
+        i = 0
+        while i < len(segments):
+            if segments[i].probability >= self.refine_threshold:
+                refined.append(segments[i])
+                i += 1
+                continue
+            # Extend over the whole run of consecutive low-confidence segments
+            j = i
+            while j + 1 < len(segments) and segments[j + 1].probability < self.refine_threshold:
+                j += 1
+            draft = segments[i:j + 1]
+
+            # Widen into the gaps around the run, but never into neighbouring speech
+            start = max(draft[0].start - 0.5, segments[i - 1].end if i else 0.0)
+            end = draft[-1].end + 0.5
+            if j + 1 < len(segments):
+                end = min(end, segments[j + 1].start)
+            clip = samples[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)]  # A view, not a copy
+            if len(clip) < MIN_REFINE_SAMPLES:
+                # Overlapping or zero-length timestamps — nothing to re-decode
+                refined.extend(draft)
+                i = j + 1
+                continue
+
+            redo = self._refiner.transcribe(clip, language=language)
+            if redo and _mean_probability(redo) > _mean_probability(draft):
+                refined.extend(
+                    TranscriptSegment(
+                        start=start + seg.start,
+                        end=min(start + seg.end, end),
+                        text=seg.text,
+                        language=seg.language,
+                        probability=seg.probability,
+                    )
+                    for seg in redo
+                )
+            else:
+                refined.extend(draft)
+            i = j + 1
+        return refined
+
+    def _decoder(self):
+        """The model itself, or a batched pipeline around it for engine="batched"."""
+        if self.engine == "sequential":
+            return self._model
+        if self._batched is None or self._batched.model is not self._model:
+            from faster_whisper import BatchedInferencePipeline
+
+            self._batched = BatchedInferencePipeline(model=self._model)
+        return self._batched
+
+    def _decode_options(self) -> dict:
+        """Decoding settings passed to faster-whisper (and folded into cache keys)."""
+        options = {
+            "vad_filter": True,
+            "vad_parameters": {"min_silence_duration_ms": 500},
+            "beam_size": self.beam_size,
+            "word_timestamps": False,
+        }
+        if self.engine == "batched":
+            options["batch_size"] = self.batch_size
+        return options
+
+    def _cache_params(self, language: str | None) -> dict:
+        return {
+            "model_size": self.model_size,
+            "compute_type": self.compute_type,
+            "language": language or "auto",
+            "engine": self.engine,
+            **self._decode_options(),
+            **({
+                "refine_model": self.refine_model,
+                "refine_threshold": self.refine_threshold,
+            } if self.refine_model else {}),
+        }
+
+    def _cores(self) -> int:
+        return self.cpu_budget or os.cpu_count() or 1
+
+    def _worker_settings(self, cpu_threads: int) -> dict:
+        """Constructor arguments that recreate this transcriber in a worker process."""
+        return {
+            "model_size": self.model_size,
+            "device": self.device,
+            "compute_type": self.compute_type,
+            "cpu_threads": cpu_threads,
+            "engine": self.engine,
+            "batch_size": self.batch_size,
+            "beam_size": self.beam_size,
+            "refine_model": self.refine_model,
+            "refine_threshold": self.refine_threshold,
+        }
+
     def transcribe_chunks(
         self,
-        chunk_paths: list[Path],
+        chunks: list[ChunkInfo] | list[Path],
         language: str | None = None,
+        workers: int = 1,
+        lock: LanguageLock | None = None,
     ) -> list[TranscriptSegment]:
         """Transcribe multiple chunks with cumulative timestamps.
 
-        Adjusts timestamps so they're continuous across all chunks.
+        Offsets come from the recorder's chunk manifest, so timestamps are
+        continuous across chunks (and across dropped silence) without
+        reopening each WAV. Plain paths are looked up in the manifest next to
+        them, falling back to WAV durations.
+
+        With workers > 1, chunks are split across a pool of worker processes,
+        each loading its own model with the machine's cores (or cpu_budget, when
+        another stage is using the rest) divided between them. Results are
+        merged back in chunk order. The pool is kept for later calls, so models
+        load once per transcriber; close() shuts it down.
+
+        Without a language, pass a LanguageLock to detect it once: the first
+        chunk is transcribed on its own to try to lock it, then the rest reuse
+        the locked language. If it has not locked (e.g. the first chunk had too
+        little speech), each worker detects the language of its own chunks and
+        the results are offered to the lock.
         """
-        self._load_model()
+        resolved = [c for c in resolve_chunks(chunks) if c.path.exists()]
         all_segments: list[TranscriptSegment] = []
-        time_offset = 0.0
+        if lock is not None and language is None and lock.language is None and resolved:
+            # Try to lock the language before fanning out, so workers skip detection
+            all_segments.extend(self.transcribe_chunk(resolved.pop(0), lock=lock))
 
-        for chunk_path in sorted(chunk_paths):
-            if not chunk_path.exists():
-                continue
+        workers = min(workers, self._cores())
+        if workers > 1 and len(resolved) > 1:
+            all_segments.extend(self._transcribe_parallel(resolved, language, workers, lock))
+            return all_segments
 
-            # Get chunk duration for offset calculation
-            chunk_duration = self._get_wav_duration(chunk_path)
-            segments = self.transcribe(chunk_path, language=language)
+        for chunk in resolved:
+            all_segments.extend(self.transcribe_chunk(chunk, language=language, lock=lock))
 
-            for seg in segments:
-                all_segments.append(TranscriptSegment(
-                    start=seg.start + time_offset,
-                    end=seg.end + time_offset,
-                    text=seg.text,
-                    language=seg.language,
-                    probability=seg.probability,
-                ))
+        return all_segments
 
-            time_offset += chunk_duration
+    def _transcribe_parallel(
+        self,
+        chunks: list[ChunkInfo],
+        language: str | None,
+        workers: int,
+        lock: LanguageLock | None = None,
+    ) -> list[TranscriptSegment]:
+        from concurrent.futures.process import BrokenProcessPool
 
-        return all_segments
+        locked = lock is not None and language is None
+        if locked:
+            language = lock.language  # Still None if nothing has locked: workers detect
+
+        executor = self._worker_pool(workers)
+        try:
+            results = executor.map(_transcribe_in_worker, chunks, [language] * len(chunks))
+            merged: list[TranscriptSegment] = []
+            for chunk, (segments, probability) in zip(chunks, results):
+                if locked and language is None:
+                    lock.offer(segments, probability)
+                elif locked and lock.confidence_dropped(segments):
+                    segments = self._redetect(chunk, lock) or segments
+                merged.extend(segments)
+            return merged
+        except BrokenProcessPool:
+            self.close()  # A worker died — start a fresh pool next time
+            raise
+
+    def _worker_pool(self, workers: int):
+        """The worker pool, rebuilt only when the worker count or settings changed."""
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Partition cores so the pool as a whole stays within the machine
+        cpu_threads = max(1, self._cores() // workers)
+        settings = self._worker_settings(cpu_threads)
+        cache_args = (self.cache.cache_dir, self.cache.max_bytes) if self.cache else None
+        key = (workers, tuple(sorted(settings.items())), cache_args)
+        if self._executor is not None and self._executor_key == key:
+            return self._executor
+
+        self.close()
+        # Spawn, not fork: this process already runs threads and has CTranslate2's
+        # OpenMP runtime loaded, which a forked child can deadlock on
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(settings, cache_args),
+        )
+        self._executor_key = key
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        executor, self._executor, self._executor_key = self._executor, None, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def transcribe_chunk(
+        self,
+        chunk: ChunkInfo,
+        language: str | None = None,
+        audio: np.ndarray | None = None,
+        lock: LanguageLock | None = None,
+    ) -> list[TranscriptSegment]:
+        """Transcribe one chunk and shift its segments to meeting time.
+
+        Uses the chunk's time map, so timestamps stay true to the meeting even
+        when the recorder dropped silent stretches. The chunk is read through a
+        memory-mapped view of its range of the session WAV (or the given in-memory samples), so the
+        model never re-decodes the file. Without a language, a LanguageLock
+        supplies the meeting's language once detected; detection reruns only
+        if the chunk's confidence drops sharply.
+        """
+        if lock is not None and language is None:
+            if lock.language is None:
+                segments = self.transcribe_chunk(chunk, audio=audio)
+                lock.offer(segments, self.last_language_probability)
+                return segments
+            segments = self.transcribe_chunk(chunk, language=lock.language, audio=audio)
+            if lock.confidence_dropped(segments):
+                return self._redetect(chunk, lock, audio) or segments
+            return segments
+
+        if audio is None:
+            try:
+                audio = read_chunk(chunk)
+            except ValueError:
+                if chunk.file_offset is not None:
+                    raise  # A range of a session file can't be handed over whole
+                audio = None  # Not 16-bit mono PCM — let faster-whisper decode it
+        segments = self.transcribe(chunk.path if audio is None else audio, language=language)
+        return [
+            TranscriptSegment(
+                start=chunk.session_time(seg.start),
+                end=chunk.session_time(seg.end),
+                text=seg.text,
+                language=seg.language,
+                probability=seg.probability,
+            )
+            for seg in segments
+        ]
 
-    @staticmethod
-    def _get_wav_duration(path: Path) -> float:
-        import wave
-        with wave.open(str(path), "rb") as wf:
-            return wf.getnframes() / wf.getframerate()
+    def _redetect(
+        self,
+        chunk: ChunkInfo,
+        lock: LanguageLock,
+        audio: np.ndarray | None = None,
+    ) -> list[TranscriptSegment] | None:
+        """Transcribe a chunk with detection; returns it only if the language changed."""
+        detected = self.transcribe_chunk(chunk, audio=audio)
+        return detected if lock.offer(detected, self.last_language_probability) else None
+
+
+def _to_float32(samples: np.ndarray) -> np.ndarray:
+    """Convert 16kHz samples to the float32 [-1, 1] array faster-whisper expects."""
+    if samples.dtype == np.float32:
+        return samples
+    audio = samples.astype(np.float32)
+    if samples.dtype == np.int16:
+        audio *= 1 / 32768
+    return audio
+
+
+def _mean_probability(segments: list[TranscriptSegment]) -> float:
+    """Duration-weighted mean avg_logprob of a run of segments."""
+    total = sum(max(s.end - s.start, 0.01) for s in segments)
+    return sum(s.probability * max(s.end - s.start, 0.01) for s in segments) / total
+
+
+# Per-process transcriber for ProcessPoolExecutor workers
+_worker_transcriber: WhisperTranscriber | None = None
+
+
+def _init_worker(settings: dict, cache_args: tuple[Path, int] | None) -> None:
+    global _worker_transcriber
+    cache = None
+    if cache_args is not None:
+        cache_dir, max_bytes = cache_args
+        cache = TranscriptCache(cache_dir, max_mb=max_bytes / (1024 * 1024))
+    _worker_transcriber = WhisperTranscriber(cache=cache, **settings)
+
+
+def _transcribe_in_worker(
+    chunk: ChunkInfo, language: str | None
+) -> tuple[list[TranscriptSegment], float | None]:
+    """A chunk's segments and, when detection ran, its language probability."""
+    segments = _worker_transcriber.transcribe_chunk(chunk, language=language)
+    return segments, _worker_transcriber.last_language_probability
+
+
+def resolve_chunks(chunks: list[ChunkInfo] | list[Path]) -> list[ChunkInfo]:
+    """Turn chunk paths into ChunkInfo using the session manifest where available.
+
+    A single-file session lists every chunk under the same path, so that path
+    resolves to all of its chunks. Paths missing from a manifest (e.g.
+    recordings made before manifests existed) get offsets from their WAV
+    durations, in filename order.
+    """
+    if all(isinstance(c, ChunkInfo) for c in chunks):
+        return sorted(chunks, key=lambda c: c.offset_samples)
+
+    manifests: dict[Path, dict[Path, list[ChunkInfo]]] = {}
+    resolved: list[ChunkInfo] = []
+    offset = 0
+    for path in sorted(set(chunks)):
+        if path.parent not in manifests:
+            manifest = SessionManifest.load(path.parent / SessionManifest.FILENAME)
+            by_path: dict[Path, list[ChunkInfo]] = {}
+            for c in manifest.chunks if manifest else []:
+                by_path.setdefault(c.path, []).append(c)
+            manifests[path.parent] = by_path
+        listed = manifests[path.parent].get(path)
+        if listed is None:
+            if not path.exists():
+                continue
+            import wave
+            with wave.open(str(path), "rb") as wf:
+                listed = [ChunkInfo(
+                    path=path,
+                    offset_samples=offset,
+                    num_samples=wf.getnframes(),
+                    sample_rate=wf.getframerate(),
+                )]
+        resolved.extend(sorted(listed, key=lambda c: c.offset_samples))
+        offset = resolved[-1].offset_samples + resolved[-1].num_samples
+    return resolved
@@ -0,0 +1,117 @@
+"""Content-addressed on-disk cache of transcription results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from .models import TranscriptSegment
+
+DEFAULT_CACHE_MB = 256
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of a file's bytes, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_audio(samples: np.ndarray) -> str:
+    """SHA-256 of in-memory or memory-mapped samples, hashed without copying."""
+    return hashlib.sha256(memoryview(np.ascontiguousarray(samples))).hexdigest()
+
+
+class TranscriptCache:
+    """Stores the segment list for each (audio hash, model, decode settings) key.
+
+    Entries are small JSON files named by key. A hit refreshes the entry's mtime,
+    and when the cache grows past max_mb the least recently used entries are
+    deleted first. Safe to share between threads; concurrent processes only
+    risk evicting slightly more or less than the cap.
+    """
+
+    def __init__(self, cache_dir: Path, max_mb: float = DEFAULT_CACHE_MB):
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._size: int | None = None  # Total bytes on disk, scanned lazily
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(audio_hash: str, params: dict) -> str:
+        """Combine the audio hash with every setting that affects the output."""
+        blob = json.dumps({"audio": audio_hash, **params}, sort_keys=True)
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def get(self, key: str) -> list[TranscriptSegment] | None:
+        path = self._entry_path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)  # Mark as recently used
+        except (OSError, json.JSONDecodeError):
+            return None
+        return [
+            TranscriptSegment(start=s, end=e, text=t, language=lang, probability=p)
+            for s, e, t, lang, p in data["segments"]
+        ]
+
+    def put(self, key: str, segments: list[TranscriptSegment]) -> None:
+        path = self._entry_path(key)
+        data = {
+            "segments": [
+                [s.start, s.end, s.text, s.language, s.probability] for s in segments
+            ]
+        }
+        payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(payload)
+            tmp.replace(path)
+        except OSError:
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(payload)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _entries(self) -> list[os.DirEntry]:
+        if not self.cache_dir.exists():
+            return []
+        entries = []
+        for shard in os.scandir(self.cache_dir):
+            if shard.is_dir():
+                entries.extend(e for e in os.scandir(shard.path) if e.name.endswith(".json"))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(e.stat().st_size for e in self._entries())
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under 90% of the cap."""
+        entries = sorted(self._entries(), key=lambda e: e.stat().st_mtime)
+        size = sum(e.stat().st_size for e in entries)
+        target = int(self.max_bytes * 0.9)
+        for entry in entries:
+            if size <= target:
+                break
+            try:
+                size -= entry.stat().st_size
+                os.unlink(entry.path)
+            except OSError:
+                continue
+        self._size = size